@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+import importlib
+import multiprocessing
+import os
+import signal
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+
+from aoc import cache, inputs, instrumentation
+from shared.logger import logger
+
+DAYS_DIR = Path(__file__).resolve().parent / 'days'
+PARTS = ('a', 'b')
+
+# Outcome of a single solver part. `answer` is None when the part failed, `error` then holds the reason.
+# `cached` is set when the answer came from the answer cache, `seconds` is then the time of the original run.
+# `counters` holds the instrumentation counters and timers of the run when they are enabled (AOC_COUNTERS).
+PartResult = namedtuple(
+    'PartResult', ('day', 'part', 'answer', 'seconds', 'error', 'cached', 'counters'), defaults=(False, None)
+)
+
+
+def get_available_days() -> list[int]:
+    """
+    return the days that have a module in aoc/days
+    """
+    return sorted(int(path.stem[3:]) for path in DAYS_DIR.glob('day[0-9][0-9].py'))
+
+
+def parse_day_selection(selection: str) -> list[int]:
+    """
+    parse a selection like '1-18' or '1,3,5-7' into a sorted list of days
+    """
+    days = set()
+    for chunk in selection.split(','):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        if '-' in chunk:
+            first, last = chunk.split('-', 1)
+            days.update(range(int(first), int(last) + 1))
+        else:
+            days.add(int(chunk))
+    return sorted(days)
+
+
+def get_day_module(day: int):
+    return importlib.import_module(f'aoc.days.day{day:02}')
+
+
+def get_input_data(module, day: int) -> str:
+    """
+    get the input data from the input store the same way the day module would:
+    example data when EXAMPLE_DATA is set, the real input otherwise
+    """
+    return inputs.load_input(day, example=getattr(module, 'EXAMPLE_DATA', False))
+
+
+@contextmanager
+def time_limit(seconds: float | None):
+    """
+    raise TimeoutError in the current (main) thread when the block runs longer than `seconds`.
+    Does nothing without a limit or on platforms without SIGALRM.
+    """
+    if not seconds or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+
+    def __on_alarm(signum, frame):
+        raise TimeoutError(f'exceeded {seconds}s')
+
+    previous_handler = signal.signal(signal.SIGALRM, __on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def has_parse_stage(module) -> bool:
+    """
+    A day can expose `parse(input_data)`. Its result is computed once and handed to both solvers as `parsed`,
+    which therefore must treat it as read-only.
+    """
+    return callable(getattr(module, 'parse', None))
+
+
+def run_day(day: int, parts: tuple = PARTS, timeout: float | None = None, use_cache: bool = True) -> list[PartResult]:
+    """
+    Solve the given parts of a day without submitting them and measure how long each solver takes.
+    When the day has a parse stage, it runs once (reported as part 'parse') and its result is passed to all parts.
+    With `use_cache`, answers for the same input and solver source are taken from the answer cache.
+    """
+    try:
+        module = get_day_module(day)
+        input_data = get_input_data(module, day)
+        cache_keys = {}
+        if use_cache:
+            answer_cache = cache.AnswerCache()
+            input_hash, source_hash = cache.hash_input(input_data), cache.hash_source(module)
+            cache_keys = {part: answer_cache.key(day, part, input_hash, source_hash) for part in parts}
+    except Exception as e:
+        return [PartResult(day, part, None, 0.0, f'{type(e).__name__}: {e}') for part in parts]
+
+    results = []
+    pending_parts = []
+    for part in parts:
+        entry = answer_cache.get(cache_keys[part]) if cache_keys else None
+        if entry:
+            results.append(PartResult(day, part, entry['answer'], entry['seconds'], None, cached=True))
+        else:
+            pending_parts.append(part)
+
+    solver_kwargs = {}
+    if pending_parts and has_parse_stage(module):
+        instrumentation.reset()
+        start = time.perf_counter()
+        try:
+            with time_limit(timeout):
+                solver_kwargs['parsed'] = module.parse(input_data)
+        except Exception as e:
+            error = f'parse failed: {type(e).__name__}: {e}'
+            return results + [PartResult(day, part, None, time.perf_counter() - start, error) for part in pending_parts]
+        seconds = time.perf_counter() - start
+        results.append(PartResult(day, 'parse', '', seconds, None, counters=instrumentation.snapshot()))
+
+    for part in pending_parts:
+        solve = getattr(module, f'solve_part_{part}')
+        instrumentation.reset()
+        start = time.perf_counter()
+        try:
+            with time_limit(timeout):
+                answer = solve(input_data, **solver_kwargs)
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+            results.append(PartResult(day, part, None, time.perf_counter() - start, error, counters=instrumentation.snapshot()))
+            continue
+        seconds = time.perf_counter() - start
+        if cache_keys:
+            answer_cache.put(cache_keys[part], str(answer), seconds)
+        results.append(PartResult(day, part, answer, seconds, None, counters=instrumentation.snapshot()))
+    return results
+
+
+def __run_task(task: tuple) -> list[PartResult]:
+    return run_day(*task)
+
+
+def __get_tasks(days: list[int], timeout: float | None, use_cache: bool) -> list[tuple]:
+    """
+    Every part is its own task, so a slow part only occupies one worker while the others keep going.
+    Days with a parse stage are one task, their parts share the parsed input in the same process.
+    """
+    tasks = []
+    for day in days:
+        try:
+            share_parse = has_parse_stage(get_day_module(day))
+        except Exception:  # the worker reports the error
+            share_parse = False
+        if share_parse:
+            tasks.append((day, PARTS, timeout, use_cache))
+        else:
+            tasks.extend((day, (part,), timeout, use_cache) for part in PARTS)
+    return tasks
+
+
+def run_days(days: list[int], processes: int | None = None, timeout: float | None = None, use_cache: bool = True) -> list[PartResult]:
+    """
+    run all parts of the given days in a process pool
+    """
+    tasks = __get_tasks(days, timeout, use_cache)
+    processes = min(processes or os.cpu_count() or 1, len(tasks)) or 1
+    results = []
+    with multiprocessing.Pool(processes=processes) as pool:
+        for task_results in pool.imap_unordered(__run_task, tasks, chunksize=1):
+            for result in task_results:
+                if result.error:
+                    logger.warning(f'❌ Day {result.day:02} part {result.part} failed after {result.seconds:.3f}s: {result.error}')
+                elif result.cached:
+                    logger.info(f'✅ Day {result.day:02} part {result.part} taken from the answer cache')
+                else:
+                    logger.info(f'✅ Day {result.day:02} part {result.part} solved in {result.seconds:.3f}s')
+            results.extend(task_results)
+    return sorted(results, key=lambda r: (r.day, r.part != 'parse', r.part))
+
+
+def format_table(rows: list[tuple]) -> str:
+    """
+    format rows of strings as a plain text table, the first row is the header
+    """
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = [' | '.join(value.ljust(width) for value, width in zip(row, widths)).rstrip() for row in rows]
+    lines.insert(1, '-+-'.join('-' * width for width in widths))
+    return '\n'.join(lines)
+
+
+def format_summary(results: list[PartResult]) -> str:
+    """
+    format the results as a table with one row per day and part,
+    with a counters column when any part reported instrumentation counters
+    """
+    with_counters = any(result.counters for result in results)
+    rows = [('Day', 'Part', 'Answer', 'Time') + (('Counters',) if with_counters else ())]
+    for result in results:
+        answer = result.answer if result.error is None else f'ERROR ({result.error})'
+        seconds = f'{result.seconds:.3f}s (cached)' if result.cached else f'{result.seconds:.3f}s'
+        row = (f'{result.day:02}', result.part, str(answer), seconds)
+        if with_counters:
+            row += (instrumentation.format_counters(result.counters),)
+        rows.append(row)
+    return format_table(rows)
+
+
+def run_batch(days: list[int], processes: int | None = None, timeout: float | None = None, use_cache: bool = True) -> list[PartResult]:
+    """
+    run the given days in parallel and log a summary table with all answers and timings
+    """
+    available_days = set(get_available_days())
+    missing_days = [day for day in days if day not in available_days]
+    if missing_days:
+        logger.warning(f'❌ Skipping days without a module: {", ".join(f"{day:02}" for day in missing_days)}')
+    days = [day for day in days if day in available_days]
+
+    logger.info(f'🎄 Running {len(days)} days with {processes or os.cpu_count()} processes...')
+    start = time.perf_counter()
+    results = run_days(days, processes=processes, timeout=timeout, use_cache=use_cache)
+    wall_time = time.perf_counter() - start
+
+    logger.info(f'\n{format_summary(results)}')
+    solver_time = sum(result.seconds for result in results if not result.cached)
+    logger.info(f'🎄 Solver time {solver_time:.3f}s, wall time {wall_time:.3f}s')
+    return results
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+import argparse
+import inspect
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from functools import partial
+
+from aoc import batch, generators
+from shared.logger import logger
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = ROOT_DIR / 'benchmarks' / 'baseline.json'
+DEFAULT_SCALING_OUTPUT = ROOT_DIR / 'benchmarks' / 'scaling.json'
+DEFAULT_SCALES = '1,10,100'
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.2  # relative slowdown of the median that counts as regression
+MIN_REGRESSION_SECONDS = 0.001  # ignore slowdowns below timer noise
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    nearest-rank percentile
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def benchmark_part(solve, input_data: str, repeat: int, timeout: float | None = None, trace_memory: bool = True) -> dict:
+    """
+    Run a solver `repeat` times and return its timing statistics plus the peak memory of one extra traced run.
+    The traced run is separate because tracemalloc slows the solver down considerably.
+    """
+    timings = []
+    answer = None
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            with batch.time_limit(timeout):
+                answer = solve(input_data)
+            timings.append(time.perf_counter() - start)
+
+        peak_memory = None
+        if trace_memory:
+            tracemalloc.start()
+            try:
+                with batch.time_limit(timeout):
+                    solve(input_data)
+                _, peak_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        return {'error': f'{type(e).__name__}: {e}'}
+
+    stats = {
+        'answer': str(answer),
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'p95': percentile(timings, 95),
+    }
+    if peak_memory is not None:
+        stats['peak_memory'] = peak_memory
+    return stats
+
+
+def measure_import_time(module_name: str) -> float:
+    """
+    Import a module in a fresh interpreter with -X importtime and return its cumulative import time in seconds.
+    A fresh interpreter is needed because every import is cached after the first one.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (str(ROOT_DIR), os.environ.get('PYTHONPATH')))))
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    # lines look like 'import time:       123 |       4567 | aoc.days.day01'
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, _, cumulative, name = (field.strip() for field in line.replace(':', '|', 1).split('|'))
+        if name == module_name:
+            return int(cumulative) / 1_000_000
+    raise ValueError(f'No import time reported for {module_name}')
+
+
+def benchmark_import(day: int, repeat: int) -> dict:
+    """
+    measure how long importing the day module takes on its own, which is paid again by every worker process
+    """
+    try:
+        timings = [measure_import_time(f'aoc.days.day{day:02}') for _ in range(repeat)]
+    except (subprocess.CalledProcessError, ValueError) as e:
+        return {'error': f'{type(e).__name__}: {e}'}
+    return {'min': min(timings), 'median': statistics.median(timings), 'p95': percentile(timings, 95)}
+
+
+def benchmark_day(module, input_data: str, repeat: int, timeout: float | None = None, parts: tuple = batch.PARTS,
+                  trace_memory: bool = True, options: dict | None = None) -> dict:
+    """
+    Benchmark the parse stage (if the day has one) and the given parts of a day on one input.
+    The input is parsed once and the result is reused for every run of the parts.
+    `options` are passed on to the solve functions that take them, e.g. the grid size of a generated input.
+    """
+    results = {}
+    solver_kwargs = dict(options or {})
+    if batch.has_parse_stage(module):
+        logger.info(f'⏱️ Benchmarking {module.__name__} parse...')
+        parse_stats = benchmark_part(module.parse, input_data, repeat, timeout=timeout, trace_memory=trace_memory)
+        parse_stats.pop('answer', None)
+        results['parse'] = parse_stats
+        if 'error' in parse_stats:
+            return dict(results, **{part: {'error': 'parse failed'} for part in parts})
+        solver_kwargs['parsed'] = module.parse(input_data)
+    for part in parts:
+        logger.info(f'⏱️ Benchmarking {module.__name__} part {part}...')
+        solve = getattr(module, f'solve_part_{part}')
+        parameters = inspect.signature(solve).parameters
+        solve = partial(solve, **{name: value for name, value in solver_kwargs.items() if name in parameters})
+        results[part] = benchmark_part(solve, input_data, repeat, timeout=timeout, trace_memory=trace_memory)
+    return results
+
+
+def run_benchmark(days: list[int], repeat: int = DEFAULT_REPEAT, timeout: float | None = None) -> dict:
+    """
+    Benchmark the import, the parse stage and both parts of every given day.
+    The input of a day is read once from the input store and reused for every run.
+    """
+    results = {}
+    available_days = set(batch.get_available_days())
+    for day in days:
+        if day not in available_days:
+            logger.warning(f'❌ Skipping day {day:02}, no module found')
+            continue
+        logger.info(f'⏱️ Benchmarking day {day:02} import...')
+        results[f'{day:02}'] = {'import': benchmark_import(day, repeat)}
+        module = batch.get_day_module(day)
+        results[f'{day:02}'].update(benchmark_day(module, batch.get_input_data(module, day), repeat, timeout=timeout))
+    return results
+
+
+def estimate_exponent(points: list[tuple[int, float]]) -> float | None:
+    """
+    Least squares slope of log(time) over log(scale): about 1 for linear, 2 for quadratic solvers.
+    Needs at least two scales with a measurable time.
+    """
+    points = [(math.log(scale), math.log(seconds)) for scale, seconds in points if seconds > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def run_scaling(days: list[int], scales: list[int], repeat: int = 1, timeout: float | None = None, seed: int = 0) -> dict:
+    """
+    Run the solvers on synthetic inputs of every scale and estimate how their time grows with the input size.
+    A scale that fails or times out is not tried again at larger scales.
+    """
+    results = {}
+    for day in days:
+        generator = generators.GENERATORS.get(day)
+        if generator is None or day not in batch.get_available_days():
+            logger.warning(f'❌ Skipping day {day:02}, no generator or no module found')
+            continue
+        module = batch.get_day_module(day)
+        day_results = results.setdefault(f'{day:02}', {})
+        failed_stages = set()
+        for scale in scales:
+            parts = tuple(part for part in generator.parts if part not in failed_stages)
+            if not parts or 'parse' in failed_stages:
+                break
+            logger.info(f'⏱️ Generating day {day:02} input at {scale}x...')
+            input_data = generator.generate(scale, seed=seed)
+            options = generator.options(scale) if generator.options else None
+            stats = benchmark_day(module, input_data, repeat, timeout=timeout, parts=parts, trace_memory=False, options=options)
+            for stage, stage_stats in stats.items():
+                day_results.setdefault(stage, {'scales': {}})['scales'][str(scale)] = stage_stats.get('median', stage_stats.get('error'))
+                if 'error' in stage_stats:
+                    failed_stages.add(stage)
+        for stage_results in day_results.values():
+            points = [(int(scale), value) for scale, value in stage_results['scales'].items() if isinstance(value, float)]
+            stage_results['exponent'] = estimate_exponent(points)
+    return results
+
+
+def format_scaling_report(results: dict, scales: list[int]) -> str:
+    rows = [('Day', 'Part', *(f'{scale}x' for scale in scales), 'Growth')]
+    for day, stages in sorted(results.items()):
+        for stage, stage_results in stages.items():
+            timings = []
+            for scale in scales:
+                value = stage_results['scales'].get(str(scale))
+                timings.append(f'{value:.4f}s' if isinstance(value, float) else (value or '-'))
+            exponent = stage_results['exponent']
+            rows.append((day, stage, *timings, f'~n^{exponent:.2f}' if exponent is not None else '-'))
+    return batch.format_table(rows)
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """
+    return a message for every part whose median got slower than the baseline by more than `threshold`
+    """
+    regressions = []
+    for day, parts in results.items():
+        for part, stats in parts.items():
+            previous = baseline.get(day, {}).get(part)
+            if not previous or 'median' not in previous or 'median' not in stats:
+                continue
+            slowdown = stats['median'] - previous['median']
+            if slowdown > MIN_REGRESSION_SECONDS and stats['median'] > previous['median'] * (1 + threshold):
+                regressions.append(
+                    f'Day {day} part {part}: median {stats["median"]:.4f}s vs {previous["median"]:.4f}s '
+                    f'({stats["median"] / previous["median"]:.2f}x)'
+                )
+    return regressions
+
+
+def format_report(results: dict) -> str:
+    rows = [('Day', 'Part', 'Min', 'Median', 'P95', 'Peak memory')]
+    for day, parts in sorted(results.items()):
+        for part, stats in parts.items():
+            if 'error' in stats:
+                rows.append((day, part, f'ERROR ({stats["error"]})', '', '', ''))
+                continue
+            rows.append((
+                day,
+                part,
+                f'{stats["min"]:.4f}s',
+                f'{stats["median"]:.4f}s',
+                f'{stats["p95"]:.4f}s',
+                f'{stats["peak_memory"] / 1024:.1f} KiB' if 'peak_memory' in stats else '-',
+            ))
+    return batch.format_table(rows)
+
+
+def load_baseline(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get('results', {})
+
+
+def save_baseline(path: Path, results: dict, repeat: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'results': results,
+    }
+    path.write_text(json.dumps(data, indent=2, sort_keys=True))
+    return None
+
+
+def __parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark the solvers and compare them to a stored baseline')
+    parser.add_argument('--days', default=None, help='days to benchmark, e.g. 1-18 or 1,3,5-7 (default: all)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='timed runs per part')
+    parser.add_argument('--timeout', type=float, default=None, help='abort a single run after this many seconds')
+    parser.add_argument('--offline', action='store_true', help='only read inputs from the input store, never use aocd')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='JSON file with the previous results')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='relative slowdown that is flagged')
+    parser.add_argument('--no-save', action='store_true', help='only compare, do not overwrite the baseline')
+    parser.add_argument('--accept', action='store_true', help='overwrite the baseline even when regressions are found')
+    parser.add_argument('--synthetic', action='store_true', help='run on generated inputs of growing size instead of the real input')
+    parser.add_argument('--scales', default=DEFAULT_SCALES, help=f'input sizes for --synthetic (default: {DEFAULT_SCALES})')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the generated inputs')
+    parser.add_argument('--scaling-output', type=Path, default=DEFAULT_SCALING_OUTPUT, help='JSON file for the --synthetic results')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = __parse_args(sys.argv[1:])
+    if args.offline:
+        os.environ['AOC_OFFLINE'] = '1'
+    days = batch.parse_day_selection(args.days) if args.days else batch.get_available_days()
+    if args.synthetic:
+        scales = [int(scale) for scale in args.scales.split(',')]
+        scaling = run_scaling(days, scales, repeat=args.repeat, timeout=args.timeout, seed=args.seed)
+        logger.info(f'\n{format_scaling_report(scaling, scales)}')
+        if not args.no_save:
+            args.scaling_output.parent.mkdir(parents=True, exist_ok=True)
+            args.scaling_output.write_text(json.dumps({'seed': args.seed, 'results': scaling}, indent=2, sort_keys=True))
+            logger.info(f'💾 Scaling results written to {args.scaling_output}')
+        sys.exit(0)
+
+    results = run_benchmark(days, repeat=args.repeat, timeout=args.timeout)
+    logger.info(f'\n{format_report(results)}')
+
+    regressions = compare_to_baseline(results, load_baseline(args.baseline), threshold=args.threshold)
+    for regression in regressions:
+        logger.warning(f'🐢 Regression: {regression}')
+    if regressions and not args.accept:
+        logger.warning(f'🐢 Baseline {args.baseline} kept, rerun with --accept to store the slower results')
+    elif not args.no_save:
+        save_baseline(args.baseline, results, args.repeat)
+        logger.info(f'💾 Baseline written to {args.baseline}')
+    sys.exit(1 if regressions else 0)
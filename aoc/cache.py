@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get('AOC_CACHE_DIR', ROOT_DIR / '.cache' / 'answers'))
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+
+def hash_input(input_data: str) -> str:
+    return hashlib.sha256(input_data.encode('utf-8')).hexdigest()
+
+
+def __get_local_dependencies(module: ModuleType) -> list[ModuleType]:
+    """
+    Collect the module and every module of this repository (aoc, shared) it uses, directly or indirectly.
+    Third party and standard library modules are ignored.
+    """
+    found = {module.__name__: module}
+    to_visit = [module]
+    while to_visit:
+        current = to_visit.pop()
+        for value in vars(current).values():
+            dependency = value if isinstance(value, ModuleType) else sys.modules.get(getattr(value, '__module__', None) or '')
+            if dependency is None or dependency.__name__ in found:
+                continue
+            file = getattr(dependency, '__file__', None)
+            if file and Path(file).resolve().is_relative_to(ROOT_DIR) and 'site-packages' not in Path(file).parts:
+                found[dependency.__name__] = dependency
+                to_visit.append(dependency)
+    return [found[name] for name in sorted(found)]
+
+
+def hash_source(module: ModuleType) -> str:
+    """
+    hash the source of a day module together with the local modules it uses,
+    so editing a solver or a shared helper invalidates the cached answers
+    """
+    sha = hashlib.sha256()
+    for dependency in __get_local_dependencies(module):
+        sha.update(dependency.__name__.encode('utf-8'))
+        sha.update(Path(dependency.__file__).read_bytes())
+    return sha.hexdigest()
+
+
+class AnswerCache:
+    """
+    Content addressed on-disk cache for solver answers.
+    An entry is keyed by day, part, the input hash and the source hash, so it never has to be invalidated by hand.
+    When the cache grows beyond `max_bytes`, the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+
+    @staticmethod
+    def key(day: int, part: str, input_hash: str, source_hash: str) -> str:
+        return hashlib.sha256(f'{day}:{part}:{input_hash}:{source_hash}'.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f'{key}.json'
+
+    def get(self, key: str) -> dict | None:
+        """return the stored entry or None, a hit marks the entry as recently used"""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text())
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key: str, answer: str, seconds: float) -> None:
+        """store an entry atomically, several worker processes may write at the same time"""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=self._directory, suffix='.tmp', delete=False) as f:
+            json.dump({'answer': answer, 'seconds': seconds}, f)
+        os.replace(f.name, self._path(key))
+        self.evict()
+        return None
+
+    def evict(self) -> None:
+        """delete the least recently used entries until the cache fits into max_bytes"""
+        entries = []
+        for path in self._directory.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:  # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+        return None
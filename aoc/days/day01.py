@@ -1,9 +1,6 @@
 #!/usr/bin/env python3
-from aocd.models import Puzzle
 from shared import utils
 from shared.logger import logger
-import logging
-logger.setLevel(logging.DEBUG)  # comment out to disable debug logging real data
 
 EXAMPLE_DATA = False
 # EXAMPLE_DATA = True
@@ -53,6 +50,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 1
     logger.info(f'🎄 Running puzzle day 01...')
@@ -1,9 +1,7 @@
 #!/usr/bin/env python3
-from aocd.models import Puzzle
+from aoc import tracing
 from shared import utils
 from shared.logger import logger
-import logging
-# logger.setLevel(logging.DEBUG)  # comment out to disable debug logging real data
 
 EXAMPLE_DATA = False
 # EXAMPLE_DATA = True  # comment out to use real data
@@ -13,14 +11,16 @@ def is_level_save(numbers_list):
     save = True
     first_direction = None
     prev_num = None
+    debug = tracing.enabled()
     for num in numbers_list:
-        logger.debug(f'prev_num={prev_num}')
-        logger.debug(f'num={num}')
+        if debug:
+            tracing.trace('prev_num=%s', prev_num)
+            tracing.trace('num=%s', num)
         if prev_num is None:
             prev_num = num
         else:
             if abs(prev_num - num) < 1 or abs(prev_num - num) > 3:
-                logger.debug('diff to big')
+                tracing.trace('diff to big')
                 save = False
                 break
             if first_direction is None:
@@ -29,7 +29,7 @@ def is_level_save(numbers_list):
                 if (prev_num < num and first_direction == 'up') or (prev_num > num and first_direction == 'down'):
                     pass
                 else:
-                    logger.debug('not steady')
+                    tracing.trace('not steady')
                     save = False
                     break
             prev_num = num
@@ -40,10 +40,10 @@ def solve_part_a(input_data: str) -> str:
     result = 0
 
     for line in utils.input_data_to_list(input_data):
-        logger.debug(line)
+        tracing.trace('%s', line)
         numbers_list = [int(num_str) for num_str in line.split(' ')]
         if is_level_save(numbers_list):
-            logger.debug('save')
+            tracing.trace('save')
             result += 1
 
     return str(result)
@@ -53,10 +53,10 @@ def solve_part_b(input_data: str) -> str:
     result = 0
 
     for line in utils.input_data_to_list(input_data):
-        logger.debug(line)
+        tracing.trace('%s', line)
         numbers_list = [int(num_str) for num_str in line.split(' ')]
         if is_level_save(numbers_list):
-            logger.debug('save')
+            tracing.trace('save')
             result += 1
         else:
             for i in range(0, len(numbers_list)):
@@ -64,7 +64,7 @@ def solve_part_b(input_data: str) -> str:
                 # _numbers_list.pop(i)
                 _numbers_list = [number for j, number in enumerate(numbers_list) if i!=j]
                 if is_level_save(_numbers_list):
-                    logger.debug('save')
+                    tracing.trace('save')
                     result += 1
                     break
 
@@ -77,6 +77,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 2
     logger.info(f'🎄 Running puzzle day 02...')
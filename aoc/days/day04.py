@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 import operator
 
-from aocd.models import Puzzle
-
 from shared import utils
 from shared.logger import logger
 
@@ -92,6 +90,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 4
     logger.info('🎄 Running puzzle day 04...')
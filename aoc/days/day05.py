@@ -1,11 +1,9 @@
 #!/usr/bin/env python3
 from typing import Tuple
 
-from aocd.models import Puzzle
+from aoc import tracing
 from shared import utils
 from shared.logger import logger
-import logging
-# logger.setLevel(logging.DEBUG)  # comment out to disable debug logging real data
 
 EXAMPLE_DATA = False
 EXAMPLE_DATA = True  # comment out to use real data
@@ -16,8 +14,8 @@ def check_print_order(print_order: list, y_after_x: dict) -> bool:
         if page in y_after_x and y_after_x[page].intersection(set(print_order[i:])):
             ok = False
             break
-    logger.debug(print_order)
-    logger.debug(ok)
+    tracing.trace('%s', print_order)
+    tracing.trace('%s', ok)
     return ok
 
 
@@ -36,11 +34,11 @@ def check_print_order_and_correct(print_order: list, y_after_x: dict) -> None:
                 print_order.insert(j, page)
                 not_ordered = True  # problem detected, try again
                 break
-    logger.debug(print_order)
+    tracing.trace('%s', print_order)
     return None
 
 
-def format_input(input_data: str) -> Tuple[dict, dict, list]:
+def parse(input_data: str) -> Tuple[dict, dict, list]:
     x_before_y = {}
     y_after_x = {}
     print_input = []
@@ -57,22 +55,23 @@ def format_input(input_data: str) -> Tuple[dict, dict, list]:
     return x_before_y, y_after_x, print_input
 
 
-def solve_part_a(input_data: str) -> str:
+def solve_part_a(input_data: str, parsed: tuple | None = None) -> str:
     result = 0
-    x_before_y, y_after_x, print_input = format_input(input_data)
+    x_before_y, y_after_x, print_input = parsed if parsed is not None else parse(input_data)
     for print_order in print_input:
         if check_print_order(print_order, y_after_x):
             result += print_order[len(print_order)//2]
     return str(result)
 
 
-def solve_part_b(input_data: str) -> str:
+def solve_part_b(input_data: str, parsed: tuple | None = None) -> str:
     result = 0
-    x_before_y, y_after_x, print_input = format_input(input_data)
+    x_before_y, y_after_x, print_input = parsed if parsed is not None else parse(input_data)
 
     for print_order in print_input:
         if check_print_order(print_order, y_after_x):
             continue
+        print_order = print_order.copy()  # the parsed input is shared with part A and must not be changed
         check_print_order_and_correct(print_order, y_after_x)
         result += print_order[len(print_order)//2]
     return str(result)
@@ -83,6 +82,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 5
     logger.info(f'🎄 Running puzzle day 05...')
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from bisect import bisect_left, bisect_right, insort
 from typing import Tuple
 
-from aocd.models import Puzzle
-
+from aoc import instrumentation, tracing
+from aoc.grid import FlatGrid
 from shared import utils
 from shared.logger import logger
 
@@ -11,93 +15,227 @@ from shared.logger import logger
 EXAMPLE_DATA = False
 # EXAMPLE_DATA = True  # comment out to use real data
 
-CHANGE_DIRECTION = {
-    'up': 'right',
-    'right': 'down',
-    'down': 'left',
-    'left': 'up'
-}
+# clockwise, turning right is moving on to the next direction
+GUARD_DIRECTIONS = ('up', 'right', 'down', 'left')
 
 
-def __get_next_position(p: utils.Point, direction: str, grid: utils.Grid) -> Tuple[utils.Point, str] | None:
-    next_p = p + utils.DIRECTIONS[direction]
-    if grid.in_bounds(next_p):
-        if grid[next_p] == '#':
-            direction = CHANGE_DIRECTION[direction]
-            next_p = p
-    else:
+class ObstacleIndex:
+    """
+    the obstructions of every row and every column as sorted lists, so the guard jumps from one turning point
+    straight to the next instead of walking cell by cell. Finding the next obstruction is a binary search.
+    Single obstructions can be added and removed again, e.g. to try a candidate in part B.
+    A row or column is only indexed when the guard first moves along it, part A touches just a few of them.
+    """
+
+    def __init__(self, grid: FlatGrid):
+        self.height = grid.height
+        self.width = grid.width
+        self._grid = grid
+        self._rows = [None] * grid.height  # x of the obstructions in a row
+        self._columns = [None] * grid.width  # y of the obstructions in a column
+
+    def row(self, y: int) -> list[int]:
+        if self._rows[y] is None:
+            self._rows[y] = self.__find_obstructions(self._grid.row(y))
+        return self._rows[y]
+
+    def column(self, x: int) -> list[int]:
+        if self._columns[x] is None:
+            self._columns[x] = self.__find_obstructions(self._grid.column(x))
+        return self._columns[x]
+
+    @staticmethod
+    def __find_obstructions(line: str) -> list[int]:
+        positions = []
+        position = line.find('#')
+        while position != -1:
+            positions.append(position)
+            position = line.find('#', position + 1)
+        return positions
+
+    def add(self, y: int, x: int) -> None:
+        insort(self.row(y), x)
+        insort(self.column(x), y)
+        return None
+
+    def remove(self, y: int, x: int) -> None:
+        self.row(y).remove(x)
+        self.column(x).remove(y)
         return None
-    return next_p, direction
 
+    def next_stop(self, y: int, x: int, direction: int) -> tuple[int, int] | None:
+        """the cell in front of the next obstruction in the direction, None if the guard leaves the map"""
+        if direction == 0:  # up
+            column = self.column(x)
+            i = bisect_left(column, y)
+            return (column[i - 1] + 1, x) if i else None
+        if direction == 1:  # right
+            row = self.row(y)
+            i = bisect_right(row, x)
+            return (y, row[i] - 1) if i < len(row) else None
+        if direction == 2:  # down
+            column = self.column(x)
+            i = bisect_right(column, y)
+            return (column[i] - 1, x) if i < len(column) else None
+        row = self.row(y)  # left
+        i = bisect_left(row, x)
+        return (y, row[i - 1] + 1) if i else None
 
-def __get_start_location(grid: utils.Grid) -> Tuple[utils.Point, str]:
-    for p, value in grid:
-        if value == '^':
-            logger.debug(f'{p}, up')
-            return p, 'up' 
-    else:
+    def exit_point(self, y: int, x: int, direction: int) -> tuple[int, int]:
+        """the last cell on the map in the direction"""
+        return ((0, x), (y, self.width - 1), (self.height - 1, x), (y, 0))[direction]
+
+
+def __get_direction_offsets(grid: FlatGrid) -> list[int]:
+    return [grid.offset(utils.DIRECTIONS[direction]) for direction in GUARD_DIRECTIONS]
+
+
+def __get_start_location(grid: FlatGrid) -> Tuple[int, int]:
+    index = grid.find('^')
+    if index == -1:
         raise Exception('Start location not found')
+    tracing.trace('%s, up', grid.point(index))
+    return index, GUARD_DIRECTIONS.index('up')
 
 
-def __get_visited_locations(guard_p: utils.Point, guard_dir: str, grid: utils.Grid) -> set:
-    visited_locations = set()
+def __get_visited_locations(guard_i: int, guard_dir: int, grid: FlatGrid, obstacles: ObstacleIndex) -> dict:
+    """
+    jump the guard from turning point to turning point until it leaves the map.
+    Maps every visited cell index to the guard state (index, direction) just before it entered the cell for the
+    first time, None for the start. An obstruction on the cell can't change the walk up to that state.
+    """
+    offsets = __get_direction_offsets(grid)
+    y, x = grid.point(guard_i)
+    visited_locations = {guard_i: None}
+    jumps = 0
     while True:
-        visited_locations.add(guard_p)
-        next_pos = __get_next_position(guard_p, guard_dir, grid)
-        if next_pos:
-            guard_p = next_pos[0]
-            guard_dir = next_pos[1]
-        else:
+        stop = obstacles.next_stop(y, x, guard_dir)
+        jumps += 1
+        end_i = grid.index(stop or obstacles.exit_point(y, x, guard_dir))
+        offset = offsets[guard_dir]
+        for i in range(guard_i + offset, end_i + offset, offset):
+            if i not in visited_locations:
+                visited_locations[i] = (i - offset, guard_dir)
+        if stop is None:
             break
+        (y, x), guard_i = stop, end_i
+        guard_dir = (guard_dir + 1) % 4
+    if instrumentation.enabled():
+        instrumentation.count('guard.jumps', jumps)
     return visited_locations
 
 
+def __is_looping(y: int, x: int, guard_dir: int, obstacles: ObstacleIndex) -> tuple[bool, int]:
+    """
+    follow the guard over the turning points only, it is in a loop once it turns at the same point in the same
+    direction a second time. Returns the result and the number of jumps.
+    """
+    turns = set()  # (y * width + x) * 4 + direction after the turn
+    jumps = 0
+    while True:
+        stop = obstacles.next_stop(y, x, guard_dir)
+        jumps += 1
+        if stop is None:
+            return False, jumps
+        y, x = stop
+        guard_dir = (guard_dir + 1) % 4
+        turn = (y * obstacles.width + x) * 4 + guard_dir
+        if turn in turns:
+            return True, jumps
+        turns.add(turn)
+
+
 def solve_part_a(input_data: str) -> str:
-    grid = utils.Grid(input_data)
-    guard_p, guard_dir = __get_start_location(grid)
-    visited_locations = __get_visited_locations(guard_p, guard_dir, grid)
+    grid = FlatGrid(input_data)
+    guard_i, guard_dir = __get_start_location(grid)
+    visited_locations = __get_visited_locations(guard_i, guard_dir, grid, ObstacleIndex(grid))
     return str(len(visited_locations))
 
 
-def solve_part_b(input_data: str) -> str:
+def __count_loops(candidates: list[tuple], obstacles: ObstacleIndex) -> tuple[list[int], int]:
+    """
+    try each candidate (y, x, guard state before the guard first enters the cell) as an obstruction,
+    returns the candidates that make the guard loop and the number of jumps
+    """
+    loops = []
+    jumps = 0
+    for y, x, guard_y, guard_x, guard_dir in candidates:
+        obstacles.add(y, x)  # the candidate is an overlay on the index, the grid itself stays unchanged
+        is_looping_loouie, loop_jumps = __is_looping(guard_y, guard_x, guard_dir, obstacles)
+        jumps += loop_jumps
+        if is_looping_loouie:
+            tracing.trace('break is_looping_loouie')
+            loops.append(y * obstacles.width + x)
+        obstacles.remove(y, x)
+    return loops, jumps
+
+
+__worker_memory = None  # the shared memory with the grid cells, attached by every pool worker
+__worker_obstacles = None  # the obstacle index of a pool worker, see __init_worker
+
+
+def __init_worker(memory_name: str, height: int, width: int, padding: int) -> None:
+    """
+    the workers read the cells of the grid from shared memory, so they are neither pickled nor copied,
+    whatever the start method. The grid is read only for the workers, the candidates are added to the obstacle index
+    of each worker as an overlay. Every worker indexes the rows and columns it needs itself.
+    """
+    global __worker_memory, __worker_obstacles
+    __worker_memory = shared_memory.SharedMemory(name=memory_name)
+    __worker_obstacles = ObstacleIndex(FlatGrid.from_buffer(__worker_memory.buf, height, width, padding))
+    return None
+
+
+def __count_loops_in_worker(candidates: list[tuple]) -> tuple[list[int], int]:
+    return __count_loops(candidates, __worker_obstacles)
+
+
+def solve_part_b(input_data: str, processes: int | None = None) -> str:
     """
     for each position in the grid that the guard visits:
-    replace position with #
-    -> check if same position (+ direction) is visited twice
+    place an obstruction there
+    -> let the guard continue from where it was just before it first reached the position
+    -> check if same turning point (+ direction) is reached twice
     if yes, break and add this position as looping loouie
     -> when done, len(looping loouie)
+    The positions are independent, with `processes` > 1 they are split across a process pool.
+    `processes` defaults to AOC_PROCESSES (the runner sets it for --processes), or 1.
     """
-    looping_loouie = set()
-    grid = utils.Grid(input_data)
-    start_p, start_dir = __get_start_location(grid)
-    guard_path = __get_visited_locations(start_p, start_dir, grid)
-
-    for p in guard_path:
-        if grid[p] in ('#', '^'):
-            continue
-        grid[p] = '#'
-        guard_p, guard_dir = start_p, start_dir
-        visited_locations = set()
-        is_looping_loouie = False
-
-        while True:
-            location = (guard_p, guard_dir)
-            if location in visited_locations:
-                is_looping_loouie = True
-                logger.debug('break is_looping_loouie')
-                break
-            visited_locations.add(location)
-            next_location = __get_next_position(guard_p, guard_dir, grid)
-            if next_location:
-                guard_p = next_location[0]
-                guard_dir = next_location[1]
-            else:
-                break            
+    if processes is None:
+        processes = int(os.environ.get('AOC_PROCESSES') or 1)
+    grid = FlatGrid(input_data)
+    obstacles = ObstacleIndex(grid)
+    start_i, start_dir = __get_start_location(grid)
+    guard_path = __get_visited_locations(start_i, start_dir, grid, obstacles)
+    candidates = []
+    for i, guard_state in guard_path.items():
+        if guard_state is not None:  # the start can't be obstructed
+            guard_i, guard_dir = guard_state
+            candidates.append((*grid.point(i), *grid.point(guard_i), guard_dir))
 
-        if is_looping_loouie:
-            looping_loouie.add(p)
-        grid[p] = '.'
+    if processes > 1 and multiprocessing.current_process().daemon:
+        # a worker of the batch runner's pool can't have a pool of its own
+        tracing.trace('Running in a daemon process, checking the candidates serially')
+        processes = 1
+    if processes > 1:
+        chunks = [candidates[i::processes * 4] for i in range(processes * 4)]
+        memory = shared_memory.SharedMemory(create=True, size=len(grid.cells))
+        try:
+            memory.buf[:len(grid.cells)] = grid.cells
+            initargs = (memory.name, grid.height, grid.width, grid.padding)
+            with multiprocessing.Pool(processes=processes, initializer=__init_worker, initargs=initargs) as pool:
+                chunk_results = pool.map(__count_loops_in_worker, chunks)
+        finally:
+            memory.close()
+            memory.unlink()
+    else:
+        chunk_results = [__count_loops(candidates, obstacles)]
+    looping_loouie = [loop for loops, _ in chunk_results for loop in loops]
 
+    if instrumentation.enabled():
+        instrumentation.count('guard.jumps', sum(jumps for _, jumps in chunk_results))
+        instrumentation.count('guard.obstructions_tried', len(candidates))
+        instrumentation.count('guard.loops_found', len(looping_loouie))
     return str(len(looping_loouie))
 
 
@@ -106,6 +244,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 6
     logger.info('🎄 Running puzzle day 06...')
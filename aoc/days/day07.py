@@ -1,19 +1,16 @@
 #!/usr/bin/env python3
 import operator
 from math import prod
-from os import MFD_ALLOW_SEALING
 
-from aocd.models import Puzzle
+from aoc import tracing
 from shared import utils
 from shared.logger import logger
-import logging
-# logger.setLevel(logging.DEBUG)  # comment out to disable debug logging real data
 
 EXAMPLE_DATA = False
 # EXAMPLE_DATA = True  # comment out to use real data
 
 
-def __get_input_data_list(input_data: str) -> list:
+def parse(input_data: str) -> list:
     input_data_list = []
     for line in utils.input_data_to_list(input_data):
         _ = line.split(':')
@@ -23,8 +20,8 @@ def __get_input_data_list(input_data: str) -> list:
                 'parts': [int(x) for x in _[1].split(' ') if x]
             }
         )
-    # logger.debug(input_data_list)
-    logger.debug(len(input_data_list))
+    # tracing.trace('%s', input_data_list)
+    tracing.trace('%s', len(input_data_list))
     return input_data_list
 
 
@@ -57,14 +54,14 @@ def __is_calculation_match(expected_result: int, previous_result: int, remaining
     return __is_calculation_match(expected_result, previous_result + remaining_numbers_list[0], remaining_numbers_list[1:], part_b=part_b)
 
 
-def solve_part_a(input_data: str) -> str:
-    input_data_list = __get_input_data_list(input_data)
+def solve_part_a(input_data: str, parsed: list | None = None) -> str:
+    input_data_list = parsed if parsed is not None else parse(input_data)
     solution = __calculate_solution_recursive(input_data_list)
     return str(solution)
 
 
-def solve_part_b(input_data: str) -> str:
-    input_data_list = __get_input_data_list(input_data)
+def solve_part_b(input_data: str, parsed: list | None = None) -> str:
+    input_data_list = parsed if parsed is not None else parse(input_data)
     solution = __calculate_solution_recursive(input_data_list, part_b = True)
     return str(solution)
 
@@ -74,6 +71,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 7
     logger.info(f'🎄 Running puzzle day 07...')
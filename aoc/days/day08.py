@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
-from aocd.models import Puzzle
-
+from aoc import tracing
 from shared import utils
 from shared.logger import logger
 
@@ -49,10 +48,12 @@ def __build_antenna_type_positions_dict(grid: utils.Grid) -> dict:
 
     # build a dict with all positions for each antenna frequency type
     antenna_type_positions_dict = {}
+    debug = tracing.enabled()
     for p, value in grid:
         if value != '.':
             antenna_type_positions_dict.setdefault(value, []).append(p)
-        logger.debug(antenna_type_positions_dict)
+        if debug:
+            tracing.trace('%s', antenna_type_positions_dict)
     return antenna_type_positions_dict
 
 
@@ -83,7 +84,7 @@ def solve_part_b(input_data: str) -> str:
         for antenna in positions:
             antinodes.add(antenna)
         __calculate_antinodes(positions, antinodes, grid, part_b=True)
-    logger.debug(antinodes)
+    tracing.trace('%s', antinodes)
     return str(len(antinodes))
 
 
@@ -92,6 +93,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 8
     logger.info('🎄 Running puzzle day 08...')
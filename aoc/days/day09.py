@@ -1,135 +1,121 @@
 #!/usr/bin/env python3
-import logging
-
-from aocd.models import Puzzle
+from heapq import heappop, heappush
+from itertools import accumulate
 
+from aoc import tracing
 from shared import utils
 from shared.logger import logger
 
-# logger.setLevel(logging.DEBUG)  # comment out to disable debug logging real data
 
 EXAMPLE_DATA = False
 # EXAMPLE_DATA = True  # overwrite
 SUBMIT = True
 # SUBMIT = False  # overwrite
 
+# the disk map digits as their values, so a file or gap length is a plain byte lookup
+DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
 
-def decompress(input_data: str) -> list:
-    is_file = True
-    decompressed = []
-    i = 0
-    for c in input_data:
-        if is_file:
-            is_file = False
-            decompressed_value = i
-            i += 1
-        else:
-            is_file = True
-            decompressed_value = None
-        for j in range(int(c)):
-            decompressed.append(decompressed_value)
-    logger.debug(decompressed)
-    return decompressed
-    
-    
-def fragment(decompressed: list) -> list:
-    fragment = decompressed.copy()
-    for i in range(len(fragment)):
-        if i < len(fragment) and fragment[i] is None:
-            while True:
-                size = fragment.pop(-1)
-                if size:
-                    fragment[i] = size
-                    break                    
-    logger.debug(fragment)
-    return fragment
-
-
-def decompress2(input_data: str) -> tuple[list, dict]:
-    is_file = True
-    decompressed = []
-    free_space_map = {}  # start_index, space_count
-    i = 0
-    free_space_index = 1
-    for c in input_data:
-        size = int(c)
-        if is_file:
-            is_file = False
-            decompressed_value = i
-            i += 1
-        else:
-            is_file = True
-            decompressed_value = None
-            if size > 0:
-                free_space_map[free_space_index] = size
-                free_space_index += 1
-            free_space_index += 1
-        if size > 0:
-            current_segment = []
-            for j in range(size):
-                current_segment.append(decompressed_value)
-            decompressed.append(current_segment)
-    logger.debug(decompressed)
-    logger.debug(free_space_map)
-    return decompressed, free_space_map
-    
-
-def fragment2(decompressed: list, free_space_map: dict) -> list:
-    for rev_i in range(len(decompressed)-1, 0, -1):
-        logger.debug(f'rev_i: {rev_i}')
-        if decompressed[rev_i][0] is None:
-            if rev_i in free_space_map:
-                free_space_map.pop(rev_i)
-        else:
-            for index, free_spaces in free_space_map.items():
-                if index > rev_i:
-                    break
-                if free_spaces >= len(decompressed[rev_i]):
-                    index_offset = 0
-                    for dot in decompressed[index]:
-                        if dot is None:
-                            break
-                        index_offset += 1
-                    else:
-                        index_offset = 0
-                    for j, num in enumerate(decompressed[rev_i]):
-                        logger.debug(f'index: {index} - j: {j} - index_offset: {index_offset} - rev_i: {rev_i}')
-                        decompressed[index][j+index_offset] = num
-                        free_space_map[index] -= 1
-                        decompressed[rev_i][j] = None
-                    if free_space_map[index] == 0:
-                        free_space_map.pop(index)
-                    break
-
-    logger.debug(decompressed)
-    logger.debug(free_space_map)
-    decompressed = [x for sublist in decompressed for x in sublist]
-    logger.debug(decompressed)
-    return decompressed
-    
 
-def solve_part_a(input_data: str) -> str:
-    decompressed = decompress(input_data)
-    fragmented = fragment(decompressed)
-    result = 0
-    for i in range(len(fragmented)):
-        result += i * fragmented[i]
-    return str(result)
-   
-    
-def solve_part_b(input_data: str) -> str:
+def read_disk_map(input_data: str) -> bytes:
+    """
+    the length of every span on the disk, files (even positions) and free space (odd positions) take turns.
+    File `n` is the span at position 2 * n. Individual blocks are never materialized.
+    """
+    return input_data.strip().encode('ascii').translate(DIGIT_VALUES)
+
+
+def span_checksum(file_id: int, start: int, length: int) -> int:
+    """checksum of `length` blocks of the file from block `start` on: file_id * (start + ... + start + length - 1)"""
+    return file_id * (2 * start + length - 1) * length // 2
+
+
+def compact_blocks_checksum(disk_map: bytes) -> int:
     """
-    todo:
-    create output as in a, but create space map
-    upadte space map from time to time
+    Checksum after moving single blocks from the end into the leftmost free space (part A).
+    Two pointers walk the disk map: the left one through the spans in their final places, the right one through
+    the file whose blocks are moved next. Each piece of a span adds its checksum in closed form.
     """
-    decompressed, free_space_map = decompress2(input_data)
-    fragmented = fragment2(decompressed, free_space_map)
-    result = 0
-    for i in range(len(fragmented)):
-        if fragmented[i] is not None:
-            result += i * fragmented[i]
-    return str(result)    
+    debug = tracing.enabled()
+    checksum = 0
+    position = 0  # block where the next piece lands
+    right = len(disk_map) - 1 if len(disk_map) % 2 else len(disk_map) - 2  # the last file
+    right_remaining = disk_map[right] if right >= 0 else 0  # blocks of it that were not moved yet
+    left = 0
+    while left < right:
+        if left % 2 == 0:  # a file that stays where it is
+            checksum += span_checksum(left // 2, position, disk_map[left])
+            position += disk_map[left]
+        else:  # free space, filled from the end
+            free = disk_map[left]
+            while free and left < right:
+                moved = min(free, right_remaining)
+                if debug:
+                    tracing.trace('Moving %s blocks of file %s to %s', moved, right // 2, position)
+                checksum += span_checksum(right // 2, position, moved)
+                position += moved
+                free -= moved
+                right_remaining -= moved
+                if right_remaining == 0:
+                    right -= 2
+                    right_remaining = disk_map[right]
+        left += 1
+    if left == right:  # what is left of the last file that was moved from
+        checksum += span_checksum(right // 2, position, right_remaining)
+    return checksum
+
+
+def compact_files_checksum(disk_map: bytes) -> int:
+    """
+    Checksum after moving whole files, from the last one on, into the leftmost free space that fits them (part B).
+    The free spaces are kept in one min-heap of start blocks per size (1..9, more where empty files join two).
+    The leftmost one that fits a file is the smallest top of the heaps for its size and up, what is left of it goes
+    into the heap of the remaining size.
+    Space that a file leaves behind is never used again: all files that are still to be moved lie left of it.
+    """
+    debug = tracing.enabled()
+    starts = list(accumulate(disk_map, initial=0))
+    free_spaces = [[] for _ in range(10)]  # appended from left to right, so every list is a heap already
+    free_start = free_size = 0
+    for i in range(1, len(disk_map), 2):
+        if not free_size:
+            free_start = starts[i]
+        free_size += disk_map[i]
+        if i + 1 < len(disk_map) and disk_map[i + 1] == 0:
+            continue  # an empty file, the free space goes on behind it
+        if free_size:
+            if free_size >= len(free_spaces):
+                free_spaces.extend([] for _ in range(free_size + 1 - len(free_spaces)))
+            free_spaces[free_size].append(free_start)
+        free_size = 0
+
+    checksum = 0
+    last_file = len(disk_map) - 1 if len(disk_map) % 2 else len(disk_map) - 2
+    for i in range(last_file, -1, -2):
+        length = disk_map[i]
+        if length == 0:
+            continue
+        start = starts[i]
+        free_size = None
+        for size in range(length, len(free_spaces)):
+            heap = free_spaces[size]
+            if heap and heap[0] < start:
+                start, free_size = heap[0], size
+        if free_size is not None:
+            heappop(free_spaces[free_size])
+            if free_size > length:
+                heappush(free_spaces[free_size - length], start + length)
+            if debug:
+                tracing.trace('Moving file %s to %s', i // 2, start)
+        checksum += span_checksum(i // 2, start, length)
+    return checksum
+
+
+def solve_part_a(input_data: str) -> str:
+    return str(compact_blocks_checksum(read_disk_map(input_data)))
+
+
+def solve_part_b(input_data: str) -> str:
+    return str(compact_files_checksum(read_disk_map(input_data)))
 
 
 def main() -> None:
@@ -137,6 +123,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 9
     logger.info('🎄 Running puzzle day 09...')
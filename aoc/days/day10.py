@@ -1,11 +1,9 @@
 #!/usr/bin/env python3
 from functools import total_ordering
 
-from aocd.models import Puzzle
+from aoc import tracing
 from shared import utils
 from shared.logger import logger
-import logging
-# logger.setLevel(logging.DEBUG)  # comment out to disable debug logging real data
 
 EXAMPLE_DATA = False
 # EXAMPLE_DATA = True  # overwrite
@@ -23,7 +21,7 @@ def __find_all_trailheads(grid: list) -> set:
             grid[y][x] = int(grid[y][x])
             if grid[y][x] == 0:
                 trailhead_set.add((y, x))
-                logger.debug(f'start_location: {(y, x)}')
+                tracing.trace('start_location: %s', (y, x))
     return trailhead_set
 
 
@@ -32,7 +30,7 @@ def __reach_summit_and_count_summits(start_y: int, start_x: int, grid: list, dif
     reach the summit and count how many different summits have been reached (same summit with different paths does not count
     """
     if grid[start_y][start_x] == 9:
-        logger.debug(f'reached summit {(start_y, start_x)}')
+        tracing.trace('reached summit %s', (start_y, start_x))
         different_summits.add((start_y, start_x))
     else:
         for direction in DIRECTIONS:
@@ -52,7 +50,7 @@ def __reach_summit_and_count_paths(start_y: int, start_x: int, grid: list, diffe
     path.add((start_y, start_x))
 
     if grid[start_y][start_x] == 9:
-        logger.debug(f'reached summit {(start_y, start_x)}')
+        tracing.trace('reached summit %s', (start_y, start_x))
         different_paths.append(path)
     else:
         for direction in DIRECTIONS:
@@ -62,9 +60,17 @@ def __reach_summit_and_count_paths(start_y: int, start_x: int, grid: list, diffe
     return None
 
 
-def solve_part_a(input_data: str) -> str:
+def parse(input_data: str) -> tuple[list, set]:
+    """
+    the grid with int heights and all trailheads, shared by both parts
+    """
     grid = utils.get_grid(input_data)
     trailhead_set = __find_all_trailheads(grid)
+    return grid, trailhead_set
+
+
+def solve_part_a(input_data: str, parsed: tuple | None = None) -> str:
+    grid, trailhead_set = parsed if parsed is not None else parse(input_data)
     total_summits = 0
     for trailhead in trailhead_set:
         different_summits = set()
@@ -73,9 +79,8 @@ def solve_part_a(input_data: str) -> str:
     return str(total_summits)
 
 
-def solve_part_b(input_data: str) -> str:
-    grid = utils.get_grid(input_data)
-    trailhead_set = __find_all_trailheads(grid)
+def solve_part_b(input_data: str, parsed: tuple | None = None) -> str:
+    grid, trailhead_set = parsed if parsed is not None else parse(input_data)
     scores = 0
     for trailhead in trailhead_set:
         different_paths = []
@@ -89,6 +94,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 10
     logger.info(f'🎄 Running puzzle day 10...')
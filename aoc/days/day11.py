@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
-import math
-from functools import lru_cache
-from typing import Counter
+from bisect import bisect_right
+from collections import Counter
+from typing import Iterator
 
-from aocd.models import Puzzle
+from aoc import tracing
 from shared import utils
 from shared.logger import logger
-import logging
-# logger.setLevel(logging.DEBUG)  # comment out to disable debug logging real data
 
 EXAMPLE_DATA = False
 # EXAMPLE_DATA = True  # overwrite
@@ -15,23 +13,43 @@ SUBMIT = True
 # SUBMIT = False  # overwrite
 
 
-@lru_cache(maxsize=None)
-def __blink_fast(stone: int, remaining_blinks: int) -> int:
-    if remaining_blinks == 0:
-        return 1
+# 10, 100, ..., a stone below POWERS_OF_TEN[k] has at most k + 1 digits, extended when a larger stone shows up
+POWERS_OF_TEN = [10 ** exponent for exponent in range(1, 64)]
 
+
+def __change_stone(stone: int) -> tuple[int, ...]:
+    """the stones one stone turns into with a blink, digits are counted and split arithmetically"""
     if stone == 0:
-        return __blink_fast(1, remaining_blinks - 1)
-    elif len(str(stone)) % 2 == 0:
-        logger.debug(f'stone: {stone}')
-        stone_len = len(str(stone))
-        left = int(str(stone)[0:stone_len // 2])
-        logger.debug(f'left: {left}')
-        right = int(str(stone)[stone_len // 2:])
-        logger.debug(f'right: {right}')
-        return __blink_fast(left, remaining_blinks - 1) + __blink_fast(right, remaining_blinks - 1)
-    else:
-        return __blink_fast(stone * 2024, remaining_blinks - 1)
+        return (1,)
+    while stone >= POWERS_OF_TEN[-1]:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    digits = bisect_right(POWERS_OF_TEN, stone) + 1
+    if digits % 2 == 0:
+        return divmod(stone, POWERS_OF_TEN[digits // 2 - 1])  # left half, right half
+    return (stone * 2024,)
+
+
+def iter_blinks(stones: list[int], blinks: int) -> Iterator[Counter]:
+    """
+    the stones after every blink as a multiset {stone: count}. Stones with the same number change the same way,
+    so every number is only handled once per blink however many stones carry it. Only the current multiset is
+    kept, memory depends on the number of distinct numbers (a few thousand), not on the number of blinks.
+    """
+    counts = Counter(stones)
+    for _ in range(blinks):
+        next_counts = Counter()
+        for stone, count in counts.items():
+            for next_stone in __change_stone(stone):
+                next_counts[next_stone] += count
+        counts = next_counts
+        yield counts
+
+
+def count_stones(stones: list[int], blinks: int) -> int:
+    counts = None
+    for blink, counts in enumerate(iter_blinks(stones, blinks), start=1):
+        tracing.trace('blink %s: %s distinct numbers', blink, len(counts))
+    return len(stones) if counts is None else sum(counts.values())
 
 
 def solve_part_a(input_data: str) -> str:
@@ -46,11 +64,7 @@ def solve_part_a(input_data: str) -> str:
     for line in utils.input_data_to_list(input_data):
         stone_list = [int(x) for x in line.split(' ')]
 
-    stone_counter = 0
-    for stone in stone_list:
-        stone_counter += __blink_fast(stone, blink_countdown)
-
-    return str(stone_counter)
+    return str(count_stones(stone_list, blink_countdown))
 
 
 def solve_part_b(input_data: str) -> str:
@@ -60,11 +74,7 @@ def solve_part_b(input_data: str) -> str:
     for line in utils.input_data_to_list(input_data):
         stone_list = [int(x) for x in line.split(' ')]
 
-    stone_counter = 0
-    for stone in stone_list:
-        stone_counter += __blink_fast(stone, blink_countdown)
-
-    return str(stone_counter)
+    return str(count_stones(stone_list, blink_countdown))
 
 
 def main() -> None:
@@ -72,6 +82,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 11
     logger.info(f'🎄 Running puzzle day 11...')
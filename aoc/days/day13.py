@@ -1,21 +1,21 @@
 #!/usr/bin/env python3
-import logging
 import re
 
-from aocd.models import Puzzle
-
+from aoc import tracing
 from shared import utils
 from shared.logger import logger
 
-# logger.setLevel(logging.DEBUG)  # comment out to disable debug logging real data
 
 EXAMPLE_DATA = False
 # EXAMPLE_DATA = True  # overwrite
 SUBMIT = True
 # SUBMIT = False  # overwrite
 
-def solve_part_a(input_data: str) -> str:
-    claw_machines_list = get_claw_machine_list(input_data)
+PRIZE_OFFSET = 10000000000000
+
+
+def solve_part_a(input_data: str, parsed: list | None = None) -> str:
+    claw_machines_list = parsed if parsed is not None else parse(input_data)
     result = 0
     for claw_machine in claw_machines_list:
         a, b = get_button_presses(claw_machine)
@@ -23,20 +23,22 @@ def solve_part_a(input_data: str) -> str:
     return str(result)
 
 
-def solve_part_b(input_data: str) -> str:
-    claw_machines_list = get_claw_machine_list(input_data, part_b=True)
+def solve_part_b(input_data: str, parsed: list | None = None) -> str:
+    claw_machines_list = parsed if parsed is not None else parse(input_data)
     result = 0
     for claw_machine in claw_machines_list:
+        prize_x, prize_y = claw_machine['Prize']
+        claw_machine = dict(claw_machine, Prize=(prize_x + PRIZE_OFFSET, prize_y + PRIZE_OFFSET))
         a, b = get_button_presses(claw_machine)
         result += get_token_costs(a, b)
     return str(result)
 
 
-def get_claw_machine_list(input_data: str, part_b: bool = False) -> list:
+def parse(input_data: str) -> list:
     claw_machines_list = []
     claw_machine = {}
     for line in utils.input_data_to_list(input_data):
-        # logger.debug(line)
+        # tracing.trace('%s', line)
         if not line:
             claw_machines_list.append(claw_machine)
             claw_machine = {}
@@ -49,14 +51,11 @@ def get_claw_machine_list(input_data: str, part_b: bool = False) -> list:
             pattern = r'X\+(\d+), Y\+(\d+)'
         match = re.search(pattern, line)
         if match:
-            if part_b and key == 'Prize':
-                claw_machine[key] = (int(match.group(1)) + 10000000000000 , int(match.group(2)) + 10000000000000)
-            else:
-                claw_machine[key] = (int(match.group(1)), int(match.group(2)))
+            claw_machine[key] = (int(match.group(1)), int(match.group(2)))
         else:
             raise Exception(f'no match found for line {line}')
     claw_machines_list.append(claw_machine)
-    logger.debug(claw_machines_list)
+    tracing.trace('%s', claw_machines_list)
     return claw_machines_list
 
 
@@ -90,6 +89,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 13
     logger.info('🎄 Running puzzle day 13...')
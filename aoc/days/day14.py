@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
 import logging
 import re
-from time import sleep
-
-from aocd.models import Puzzle
 
+from aoc import tracing
 from shared import utils
 from shared.logger import logger
 
@@ -18,54 +16,67 @@ SUBMIT = True
 # SUBMIT = False
 
 
-def solve_part_a(input_data: str) -> str:
-    columns: int = 11 if EXAMPLE_DATA else 101  # wide
-    rows: int = 7 if EXAMPLE_DATA else 103  # tall  
-    seconds: int = 100
+def solve_part_a(input_data: str, parsed: list | None = None, columns: int | None = None, rows: int | None = None,
+                 seconds: int = 100) -> str:
+    columns, rows = get_dimensions(columns, rows)
     quadrants: dict = {'a': 0, 'b': 0, 'c': 0, 'd': 0}
 
-    robots: list = getRobots(input_data)
+    robots: list = parsed if parsed is not None else parse(input_data)
     for robot in robots:
         y, x = get_robot_position_after_seconds(robot, seconds, columns, rows)
         countQuadrant(y, x, quadrants, columns, rows)
-        logger.debug(f"Robot {robot} position after {seconds} seconds: {y}", {x})
+        tracing.trace('Robot %s position after %s seconds: %s, %s', robot, seconds, y, x)
     robot_per_quadrant_multiplied = 1
-    logger.debug(f"Quadrants: {quadrants}")
+    tracing.trace('Quadrants: %s', quadrants)
     for quadrant_robot_count in quadrants.values():
         robot_per_quadrant_multiplied *= quadrant_robot_count
     return str(robot_per_quadrant_multiplied)
 
 
-def solve_part_b(input_data: str) -> str:
-    columns: int = 11 if EXAMPLE_DATA else 101  # wide
-    rows: int = 7 if EXAMPLE_DATA else 103  # tall    
-    initial_grid = [['.' for _ in range(columns)] for _ in range(rows)]
+def solve_part_b(input_data: str, parsed: list | None = None, columns: int | None = None, rows: int | None = None,
+                 line_length: int = 10) -> str:
+    columns, rows = get_dimensions(columns, rows)
     seconds: int = 0
-    
-    robots: list = getRobots(input_data)
+
+    robots: list = parsed if parsed is not None else parse(input_data)
     tree_found: bool = False
     while not tree_found:
-        grid = [row.copy() for row in initial_grid]
-        for robot in robots:
-            y, x = get_robot_position_after_seconds(robot, seconds, columns, rows)
-            grid[y][x] = '#'
-        for row in grid:
-            if "##########" in ''.join(row):
-                tree_found = True
+        # only the occupied cells are looked at, the cost per second doesn't depend on the size of the area
+        positions = {get_robot_position_after_seconds(robot, seconds, columns, rows) for robot in robots}
+        tree_found = has_horizontal_line(positions, line_length)
         if tree_found:
-            for row in grid:
-                print(' '.join(row))
-            sleep(3)        
+            tracing.trace('%s', tracing.Lazy(lambda: '\n'.join(
+                ' '.join('#' if (y, x) in positions else '.' for x in range(columns)) for y in range(rows)
+            )))
         else:
-            seconds += 1       
+            seconds += 1
     return str(seconds)
 
 
-def getRobots(input_data: str) -> list:
+def get_dimensions(columns: int | None, rows: int | None) -> tuple[int, int]:
+    """the size of the area, defaults to the puzzle (or example) size"""
+    if columns is None:
+        columns = 11 if EXAMPLE_DATA else 101  # wide
+    if rows is None:
+        rows = 7 if EXAMPLE_DATA else 103  # tall
+    return columns, rows
+
+
+def has_horizontal_line(positions: set, line_length: int) -> bool:
+    """True if `line_length` occupied positions (y, x) follow each other in a row"""
+    for y, x in positions:
+        if (y, x - 1) in positions:
+            continue  # not the left end of a line
+        if all((y, x + i) in positions for i in range(1, line_length)):
+            return True
+    return False
+
+
+def parse(input_data: str) -> list:
     pattern = r'p=(-?\d+),(-?\d+)\s+v=(-?\d+),(-?\d+)'
     robots: list = []
     for line in utils.input_data_to_list(input_data):
-        # logger.debug(line)
+        # tracing.trace('%s', line)
         matches = re.match(pattern, line)
         if matches:
             robot = {
@@ -73,7 +84,7 @@ def getRobots(input_data: str) -> list:
                 'v': (int(matches.group(4)), int(matches.group(3)))
             }
             robots.append(robot)
-            logger.debug(f"Added robot: {robot}")
+            tracing.trace('Added robot: %s', robot)
         else:
             raise ValueError(f"Invalid input line: {line}")    
     return robots
@@ -103,6 +114,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 14
     logger.info('🎄 Running puzzle day 14...')
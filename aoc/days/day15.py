@@ -2,8 +2,8 @@
 import logging
 from typing import List, Tuple
 
-from aocd.models import Puzzle
-
+from aoc import tracing
+from aoc.grid import OUTSIDE, FlatGrid
 from shared import utils
 from shared.logger import logger
 from shared.utils import Point
@@ -18,35 +18,28 @@ SUBMIT = True
 # EXAMPLE_DATA = True
 
 # --- Constants ---
-ROBOT = '@'
-WALL = '#'
-EMPTY = '.'
-BOX = 'O'
-BOX_LEFT = '['
-BOX_RIGHT = ']'
+# Cell values of the flat grid, unpacking bytes gives the byte value of each character.
+ROBOT, WALL, EMPTY, BOX, BOX_LEFT, BOX_RIGHT = b'@#.O[]'
+BORDER = ord(OUTSIDE)  # the sentinel cells around the grid block like walls
 
 
-def solve_part_a(input_data: str) -> str:
+def solve_part_a(input_data: str, parsed: tuple | None = None) -> str:
     """Solves part A of the puzzle."""
-    grid, movements = parse_input(input_data)
-    return str(run_simulation(grid, movements))
+    grid_str, movements = parsed if parsed is not None else parse(input_data)
+    return str(run_simulation(FlatGrid(grid_str), movements))
 
 
-def solve_part_b(input_data: str) -> str:
+def solve_part_b(input_data: str, parsed: tuple | None = None) -> str:
     """Solves part B of the puzzle."""
-    grid, movements = parse_input(input_data, part_b=True)
-    return str(run_simulation(grid, movements))
+    grid_str, movements = parsed if parsed is not None else parse(input_data)
+    return str(run_simulation(double_grid(grid_str), movements))
     
     
-def parse_input(input_data: str, part_b: bool = False) -> Tuple[utils.Grid, List[Point]]:
-    """Parses the input data into a grid and a list of movement points."""
+def parse(input_data: str) -> Tuple[str, List[Point]]:
+    """Parses the input data into the grid string and a list of movement points. Each part builds its own grid from the string."""
     grid_str, movements_str = input_data.split('\n\n', 1)
-    if part_b:
-        grid = double_grid(grid_str)
-    else:
-        grid = utils.Grid(grid_str)
     movements = parse_movements(movements_str)
-    return grid, movements
+    return grid_str, movements
 
 
 def parse_movements(movements_str: str) -> List[Point]:
@@ -54,64 +47,70 @@ def parse_movements(movements_str: str) -> List[Point]:
     return [utils.STRAIGHT_DIRECTIONS_SYMBOL[c] for c in movements_str if c in utils.STRAIGHT_DIRECTIONS_SYMBOL]
 
 
-def double_grid(grid_data: str) -> utils.Grid:
+def double_grid(grid_data: str) -> FlatGrid:
     """Creates a new grid with doubled width according to part B rules."""
     mapping = {
-        WALL: WALL * 2,
-        BOX: BOX_LEFT + BOX_RIGHT,
-        EMPTY: EMPTY * 2,
-        ROBOT: ROBOT + EMPTY,
+        chr(WALL): chr(WALL) * 2,
+        chr(BOX): chr(BOX_LEFT) + chr(BOX_RIGHT),
+        chr(EMPTY): chr(EMPTY) * 2,
+        chr(ROBOT): chr(ROBOT) + chr(EMPTY),
     }
     new_grid_lines = []
     for line in grid_data.splitlines():
         if line:
             new_grid_lines.append(''.join(mapping.get(char, '') for char in line))
-    return utils.Grid('\n'.join(new_grid_lines))
+    return FlatGrid('\n'.join(new_grid_lines))
 
     
-def run_simulation(grid: utils.Grid, movements: List[Point]) -> int:
+def run_simulation(grid: FlatGrid, movements: List[Point]) -> int:
     """Runs the robot simulation on a given grid and returns the final GPS score."""
     robot_position = get_robot_start(grid)
+    offsets = {movement: grid.offset(movement) for movement in set(movements)}
     for movement in movements:
-        new_robot_position, boxes_to_push = check_robot_move(grid, movement, robot_position)
+        direction = offsets[movement]
+        new_robot_position, boxes_to_push = check_robot_move(grid.cells, direction, robot_position)
         if robot_position != new_robot_position:
-            robot_position = move_robot(robot_position, new_robot_position, movement, boxes_to_push, grid)
-    logger.debug(grid)
+            robot_position = move_robot(robot_position, new_robot_position, direction, boxes_to_push, grid.cells)
+    tracing.trace('%s', grid)
     return calc_total_gps(grid)
 
 
-def get_robot_start(grid: utils.Grid) -> Point:
-    """Finds the starting position of the robot."""
-    for p, val in grid:
-        if val == ROBOT:
-            return p
-    raise ValueError('No robot start point found in the grid')
+def get_robot_start(grid: FlatGrid) -> int:
+    """Finds the cell index of the robot."""
+    index = grid.find(chr(ROBOT))
+    if index == -1:
+        raise ValueError('No robot start point found in the grid')
+    return index
 
 
-def get_box_at(position: Point, grid: utils.Grid) -> Tuple[Point, Point] | None:
-    """If position is part of a 2-cell box, returns the two points of the box, else None."""
-    if grid[position] == BOX_LEFT:
-        return position, position + Point(0, 1)
-    if grid[position] == BOX_RIGHT:
-        return position + Point(0, -1), position
+def get_box_at(position: int, cells: bytearray) -> Tuple[int, int] | None:
+    """If position is part of a 2-cell box, returns the two cell indices of the box, else None."""
+    if cells[position] == BOX_LEFT:
+        return position, position + 1
+    if cells[position] == BOX_RIGHT:
+        return position - 1, position
     return None
 
 
-def check_robot_move(grid: utils.Grid, direction: Point, robot_position: Point) -> Tuple[Point, List]:
-    """Checks if a move is possible and returns the new position and any boxes that would be pushed."""
+def check_robot_move(cells: bytearray, direction: int, robot_position: int) -> Tuple[int, List]:
+    """
+    Checks if a move is possible and returns the new position and any boxes that would be pushed.
+    Positions are cell indices and the direction is an index offset of the flat grid.
+    The border around the grid blocks like a wall, so a map without walls can't be left either.
+    """
     new_robot_position = direction + robot_position
     boxes_to_push = []
     stack = {new_robot_position}
-    processed = set()  # Contains single points and tuples of points (boxes)
+    processed = set()  # Contains single indices and tuples of indices (boxes)
 
     while stack:
         current_pos = stack.pop()
         if current_pos in processed:
             continue
 
-        obj_at_pos = grid[current_pos]
+        obj_at_pos = cells[current_pos]
 
-        if not obj_at_pos or obj_at_pos == WALL:
+        if obj_at_pos == WALL or obj_at_pos == BORDER:
             return robot_position, []  # Blocked move
 
         if obj_at_pos == EMPTY:
@@ -122,8 +121,8 @@ def check_robot_move(grid: utils.Grid, direction: Point, robot_position: Point)
         if obj_at_pos == BOX:
             boxes_to_push.append(current_pos)
             stack.add(direction + current_pos)
-        elif obj_at_pos in [BOX_LEFT, BOX_RIGHT]:
-            box = get_box_at(current_pos, grid)
+        elif obj_at_pos == BOX_LEFT or obj_at_pos == BOX_RIGHT:
+            box = get_box_at(current_pos, cells)
             if box and box not in processed:
                 boxes_to_push.append(box)
                 processed.add(box)
@@ -133,13 +132,13 @@ def check_robot_move(grid: utils.Grid, direction: Point, robot_position: Point)
     return new_robot_position, boxes_to_push
 
 
-def move_robot(robot_position: Point, new_robot_position: Point, direction: Point, boxes_to_push: list, grid: utils.Grid) -> Point:
+def move_robot(robot_position: int, new_robot_position: int, direction: int, boxes_to_push: list, cells: bytearray) -> int:
     """Executes the move, updating the grid with new robot and box positions."""
     to_clear = {robot_position}
     to_set = {new_robot_position: ROBOT}
 
     for box in boxes_to_push:
-        if isinstance(box, Point):  # Single 'O' box
+        if isinstance(box, int):  # Single 'O' box
             to_clear.add(box)
             to_set[direction + box] = BOX
         else:  # Tuple for '[]' box
@@ -150,24 +149,27 @@ def move_robot(robot_position: Point, new_robot_position: Point, direction: Poin
     # Clear old positions, careful not to clear a spot that will be occupied
     for p in to_clear:
         if p not in to_set:
-            grid[p] = EMPTY
+            cells[p] = EMPTY
 
     # Set new positions
     for p, val in to_set.items():
-        grid[p] = val
+        cells[p] = val
 
     return new_robot_position
 
 
-def calc_total_gps(grid: utils.Grid) -> int:
+def calc_total_gps(grid: FlatGrid) -> int:
     """Calculates the total GPS signal strength from all boxes."""
-    return sum(y * 100 + x for (y, x), val in grid if val in (BOX, BOX_LEFT))
+    box_indices = grid.find_all(chr(BOX)) + grid.find_all(chr(BOX_LEFT))
+    return sum(y * 100 + x for y, x in map(grid.point, box_indices))
 
 
 def main() -> None:
     """
     Execute the solve functions for each part and submit the solution for the specified year and day.
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 15
     logger.info('🎄 Running puzzle day 15...')
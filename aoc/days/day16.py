@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 import logging
-from collections import namedtuple
-from heapq import heapify, heappop, heappush
-
-from aocd.models import Puzzle
+from collections import ChainMap, namedtuple
 
+from aoc import instrumentation, search, tracing
+from aoc.grid import OUTSIDE, FlatGrid, decode_state, encode_state
 from shared import utils
 from shared.logger import logger
 from shared.utils import Point
@@ -34,277 +33,294 @@ DIRECTION_SYMBOLS = {
     3: '^',
 }
 
-# Represents a node in the graph, consisting of a Point (p) for its grid coordinates
+# Represents a node on a shortest path, consisting of a Point (p) for its grid coordinates
 # and an integer direction (d) indicating the direction of arrival at this point.
 Node = namedtuple('Node', ('p', 'd'))
 
-def solve_part_a(input_data: str) -> str:
-    grid, wall_coordinates_set, start_point, end_point = parse_input(input_data)
-    graph = {}
-    add_all_labyrinth_edges_to_graph(graph, wall_coordinates_set, Node(start_point, 0))
-    all_shortest_paths, cost = get_all_shortest_paths(graph, Node(start_point, 0), end_point)
-    logger.debug(f'Found {len(all_shortest_paths)} shortest paths with cost {cost}')
+# Inside the search, a node is a single int: the cell index in the flat grid and the direction packed with
+# aoc.grid.encode_state. The costs and the predecessors of the search are keyed by these ints.
+# Byte values of the cells the reindeer cannot enter.
+BLOCKED_CELLS = b'#' + OUTSIDE.encode('ascii')
+
+# A corridor of the compressed maze, leaving a stop cell in the direction `exit`.
+# `end` is the encoded node at the next stop cell (with the direction of arrival), `cost` includes the turns
+# inside the corridor and `tiles` are the cell indices after the start cell up to and including the end cell.
+Corridor = namedtuple('Corridor', ('exit', 'end', 'cost', 'tiles'))
+
+
+def solve_part_a(input_data: str, parsed: tuple | None = None) -> str:
+    grid, corridors, result = parsed if parsed is not None else parse(input_data)
 
     # Optional: Visualize the shortest paths found for debugging or demonstration.
-    grid[Point(0, 0)] = f'\033[39m{grid[Point(0, 0)]}'  # Reset color for the first char
-    for _shortest_path in all_shortest_paths: # Ensure there is at least one path
-        _grid = grid.copy()
-        # Mark the path nodes with their direction symbols, colored red.
-        for node in _shortest_path[1:-1]: # Exclude start and end for clear visualization
-            _grid[node.p] = f'\033[31m{DIRECTION_SYMBOLS[node.d]}\033[39m'  # color path red
-        logger.debug(_grid) # Log the colored grid
-    return str(cost)
-
-
-def solve_part_b(input_data: str) -> str:
-    grid, wall_coordinates_set, start_point, end_point = parse_input(input_data)
-    graph = {}
-    add_all_labyrinth_edges_to_graph(graph, wall_coordinates_set, Node(start_point, 0))
-    all_shortest_paths, cost = get_all_shortest_paths(graph, Node(start_point, 0), end_point)
-    logger.debug(f'Found {len(all_shortest_paths)} shortest paths with cost {cost}')
-
-    # Collect all unique Point objects (grid locations) from all nodes in all shortest paths.
-    visited_locations = {node.p for shortest_path in all_shortest_paths for node in shortest_path}
-            
+    # Copying the grid for every path is expensive, so it only happens with debug logging enabled.
+    if tracing.enabled():
+        for _shortest_path in search.iter_shortest_paths(result):
+            _grid = utils.Grid(str(grid))  # a utils.Grid cell can hold the color codes
+            _grid[Point(0, 0)] = f'\033[39m{grid[Point(0, 0)]}'  # Reset color for the first char
+            # Mark the path nodes with their direction symbols, colored red.
+            for node in expand_path(grid, corridors, _shortest_path)[1:-1]: # Exclude start and end for clear visualization
+                _grid[node.p] = f'\033[31m{DIRECTION_SYMBOLS[node.d]}\033[39m'  # color path red
+            tracing.trace('%s', _grid) # Log the colored grid
+    return str(result.cost)
+
+
+def solve_part_b(input_data: str, parsed: tuple | None = None) -> str:
+    grid, corridors, result = parsed if parsed is not None else parse(input_data)
+
+    # Collect all unique grid locations on any shortest path. The predecessor DAG of the search is
+    # walked once, the (possibly exponentially many) paths themselves are never built.
+    visited_locations = get_tiles_on_shortest_paths(corridors, result)
+
     return str(len(visited_locations))
 
 
-def parse_input(input_data: str) -> tuple[utils.Grid, set, Point, Point]:
+def parse(input_data: str) -> tuple[FlatGrid, ChainMap, search.SearchResult]:
     """
-    Parses the raw input string into a grid, identifying wall locations ('#'),
-    the start point ('S'), and the end point ('E').
+    Parses the maze, compresses its corridors and searches all shortest paths once,
+    part A and part B are both answered from the result.
 
     Args:
         input_data: The raw input string from the puzzle.
 
     Returns:
         A tuple containing:
-            - grid: A utils.Grid object representing the entire puzzle area.
-            - wall_coordinates_set: A set of Point objects corresponding to wall cells.
-            - start_point: A Point object for the 'S' location.
-            - end_point: A Point object for the 'E' location.
-
-    Raises:
-        ValueError: If either the start or end point is not found in the input.
+            - grid: A FlatGrid object representing the entire puzzle area.
+            - corridors: The corridors of the compressed maze, see `CorridorGraph.with_stops`.
+            - result: The search result with the cost of the shortest paths (`None` if the end
+                      cannot be reached) and all predecessors on them, see `find_shortest_paths`.
     """
-    grid = utils.Grid(input_data)
-    wall_coordinates_set = set()
-    start_point = None
-    end_point = None
-    # Iterate through each cell in the grid to identify special locations.
-    for p, value in grid:
-        current_coordinate = p
-        if value == '#':
-            wall_coordinates_set.add(current_coordinate)
-        elif value == 'S':
-            start_point = current_coordinate
-        elif value == 'E':
-            end_point = current_coordinate
+    grid, start_index, end_index = parse_input(input_data)
+    corridor_graph = CorridorGraph(grid)
+    corridors = corridor_graph.with_stops(start_index, end_index)
+    tracing.trace('Compressed the maze to %s stop cells', len(corridors))
+    result = find_shortest_paths(corridors, encode_state(start_index, 0), end_index)
+    tracing.trace('Found %s shortest paths with cost %s', tracing.Lazy(lambda: search.count_shortest_paths(result)), result.cost)
+    return grid, corridors, result
 
-    # Ensure both start and end points were found.
-    if not (start_point and end_point):
-        raise ValueError('Start and end points not found')
 
-    return grid, wall_coordinates_set, start_point, end_point
+def decode_node(grid: FlatGrid, node: int) -> Node:
+    """Turns an encoded node of the search back into a Node with a Point."""
+    index, d = decode_state(node)
+    return Node(grid.point(index), d)
 
 
-def add_all_labyrinth_edges_to_graph(graph: dict, wall_coordinates_set: set, start_node: Node) -> None:
+def expand_path(grid: FlatGrid, corridors: ChainMap, path: list[int]) -> list[Node]:
     """
-    Constructs a directed graph where each node is a (Point, Direction) pair.
-    Edges are added for valid movements, and their weights are calculated based on
-    whether the movement changes direction. This effectively performs a BFS/DFS
-    to discover all reachable (point, direction) states and their connections.
+    Expands a path of the compressed maze (encoded nodes at stop cells) into a Node for every tile.
 
     Args:
-        graph: The dictionary representing the adjacency list of the graph.
-               It will be populated in the format: {Node: {Neighbor_Node: weight}}.
-        wall_coordinates_set: A set of Point objects marking impassable walls.
-        start_node: The initial node (Point, Direction) from which to begin
-                    exploring and building the graph.
-    """
-    visited_nodes_set = set()
-    nodes_to_visit = [start_node] # Using a list as a stack for a DFS-like exploration
-
-    while nodes_to_visit:
-        current_node = nodes_to_visit.pop()
-        # If this node has already been fully processed, skip it.
-        if current_node in visited_nodes_set:
-            continue
-        visited_nodes_set.add(current_node)
-
-        # Explore all four possible cardinal directions from the current point.
-        for _key, p in DIRECTIONS.items(): # _key is the integer representation of the neighbor's direction
-            neighbor_point = current_node.p + p
-            
-            # Skip if the neighbor point is a wall or outside the grid boundaries.
-            if neighbor_point in wall_coordinates_set:
-                continue
-            
-            # Calculate the weight for the edge. Movement costs 1, plus a penalty
-            # for changing direction. The penalty is 1000 per 90-degree turn.
-            # `_key` is the direction of movement to the neighbor, `current_node.d`
-            # is the direction from which `current_node` was approached.
-            # `min(abs(_key - current_node.d), 4 - abs(_key - current_node.d))`
-            # calculates the minimum angular difference (e.g., 0 for straight,
-            # 1 for 90 degrees, 2 for 180 degrees).
-            weight_multiplicator = min(abs(_key - current_node.d), 4 - abs(_key - current_node.d))
-            weight = 1 + (1000 * weight_multiplicator)
-            
-            neighbor_node = Node(neighbor_point, _key)
-            add_edge(graph, current_node, neighbor_node, weight)
-            # Add the neighbor node to the list to be visited, ensuring all reachable
-            # (point, direction) states are processed.
-            nodes_to_visit.append(neighbor_node)
-    return None
+        grid: The FlatGrid of the maze.
+        corridors: The corridors of the compressed maze.
+        path: The encoded nodes of a path, start ... end.
 
-
-def add_edge(graph: dict, node1: Node, node2: Node, weight: int) -> None:
-    """
-    Adds a directed edge from `node1` to `node2` with a specified `weight`
-    to the given graph. If `node1` is not yet in the graph, it is initialized.
-
-    Args:
-        graph: The graph dictionary (adjacency list).
-        node1: The source Node.
-        node2: The destination Node.
-        weight: The cost associated with traversing this edge.
+    Returns:
+        The Nodes of every tile on the path, each with the direction it is entered in.
     """
-    graph.setdefault(node1, {}) # Ensure node1 has an entry in the graph
-    graph[node1][node2] = weight # Add/update the edge to node2 with its weight
-    return None
+    offset_directions = {grid.offset(direction): d for d, direction in DIRECTIONS.items()}
+    nodes = [decode_node(grid, path[0])]
+    for node1, node2 in zip(path, path[1:]):
+        previous_index = decode_state(node1)[0]
+        for index in get_corridor(corridors, node1, node2).tiles:
+            nodes.append(Node(grid.point(index), offset_directions[index - previous_index]))
+            previous_index = index
+    return nodes
 
 
-def do_dijkstra(graph: dict, start_node: Node) -> tuple[dict, dict]:
+def parse_input(input_data: str) -> tuple[FlatGrid, int, int]:
     """
-    Executes Dijkstra's algorithm to find the shortest paths (and their costs)
-    from a `start_node` to all other reachable nodes in a graph.
-    It also records all predecessors for each node, allowing for reconstruction
-    of multiple shortest paths if they exist.
+    Parses the raw input string into a flat grid and finds
+    the start point ('S') and the end point ('E').
 
     Args:
-        graph: The adjacency list representation of the graph.
-               {Node: {Neighbor_Node: weight}}.
-        start_node: The starting node (Point, Direction) for Dijkstra's algorithm.
+        input_data: The raw input string from the puzzle.
 
     Returns:
         A tuple containing:
-            - path_costs_for_each_node: A dictionary mapping each Node to its
-                                        minimum accumulated cost from `start_node`.
-            - predecessors: A dictionary mapping each Node to a list of its
-                            predecessor Nodes on *all* shortest paths.
-    """
-    # Initialize costs: 0 for start_node, infinity for all others implicitly.
-    path_costs_for_each_node = {start_node: 0}
-    # Initialize predecessors: empty list for start_node.
-    predecessors: dict[Node, list[Node]] = {start_node: []}
+            - grid: A FlatGrid object, walls are the '#' cells.
+            - start_index: The cell index of the 'S' location.
+            - end_index: The cell index of the 'E' location.
 
-    # Initialize a min-priority queue with the start node and its cost.
-    # The heap stores tuples of (cost, node).
-    priority_queue = [(0, start_node)]
-    heapify(priority_queue)
-
-    while priority_queue:  # Continue as long as there are nodes to process
-        current_weight, current_node = heappop(priority_queue)
+    Raises:
+        ValueError: If either the start or end point is not found in the input.
+    """
+    grid = FlatGrid(input_data)
+    start_index = grid.find('S')
+    end_index = grid.find('E')
 
-        # If we've already found a shorter path to `current_node`, skip this (stale) entry.
-        if current_weight > path_costs_for_each_node.get(current_node, float('inf')):
-            continue
+    # Ensure both start and end points were found.
+    if start_index == -1 or end_index == -1:
+        raise ValueError('Start and end points not found')
 
-        # If the current node has no outgoing edges, it's a dead end in the graph, skip.
-        if current_node not in graph:
-            continue
+    return grid, start_index, end_index
 
-        # Explore all neighbors of the current node.
-        for neighbor_node, weight in graph.get(current_node, {}).items():
-            # Calculate the total cost to reach the `neighbor_node` through `current_node`.
-            tentative_cost = current_weight + weight
 
-            # If this path offers a shorter cost to `neighbor_node` than previously known:
-            if tentative_cost < path_costs_for_each_node.get(neighbor_node, float('inf')):
-                path_costs_for_each_node[neighbor_node] = tentative_cost # Update the shortest cost
-                predecessors[neighbor_node] = [current_node] # This is now the *only* known predecessor for this shortest path
-                heappush(priority_queue, (tentative_cost, neighbor_node)) # Add neighbor to priority queue
-            # If this path offers an equally short cost:
-            elif tentative_cost == path_costs_for_each_node.get(neighbor_node, float('inf')):
-                predecessors.setdefault(neighbor_node, []).append(current_node) # Add current_node as an alternative predecessor
+class CorridorGraph:
+    """
+    The maze with every corridor contracted into a single weighted edge.
 
-    return path_costs_for_each_node, predecessors
+    Only junctions and dead ends (open cells without exactly two open neighbors) are kept as stop cells.
+    Between two stop cells the reindeer can only follow the corridor: every corridor cell has one way in and
+    one way out, and turning around inside a corridor is never part of a shortest path. Dijkstra therefore
+    only has to look at the stop cells, and each corridor remembers its cost (turns included) and its tiles.
 
+    The compressed graph does not depend on the start and end point, `with_stops` adds them for one query.
+    """
 
-def get_all_shortest_paths(graph: dict, start_node: Node, end_point: Point) -> tuple[list[list[Node]], int | None]:
+    def __init__(self, grid: FlatGrid):
+        self._cells = grid.cells
+        self._offsets = [grid.offset(DIRECTIONS[d]) for d in range(len(DIRECTIONS))]
+        open_cells = [index for index, value in enumerate(self._cells) if value not in BLOCKED_CELLS]
+        self.stop_cells = {index for index in open_cells if len(self._get_exits(index)) != 2}
+        self.corridors = {index: self._walk_corridors(index, self.stop_cells.__contains__) for index in self.stop_cells}
+
+    def _get_exits(self, index: int) -> list[int]:
+        return [d for d, offset in enumerate(self._offsets) if self._cells[index + offset] not in BLOCKED_CELLS]
+
+    def _walk_corridors(self, index: int, is_stop) -> list[Corridor]:
+        return [self._walk(index, exit_direction, is_stop) for exit_direction in self._get_exits(index)]
+
+    def _walk(self, index: int, exit_direction: int, is_stop) -> Corridor:
+        """
+        Follows the corridor that leaves `index` in `exit_direction` until the next stop cell.
+
+        Args:
+            index: The cell index the corridor starts at.
+            exit_direction: The direction the corridor is entered in.
+            is_stop: Tells whether a cell index ends the corridor.
+
+        Returns:
+            The Corridor.
+        """
+        cells = self._cells
+        offsets = self._offsets
+        direction = exit_direction
+        current = index + offsets[direction]
+        cost = 1
+        tiles = [current]
+        while not is_stop(current):
+            # A corridor cell has exactly two open neighbors and one of them is behind the reindeer.
+            for next_direction in (direction, (direction + 1) % 4, (direction + 3) % 4):
+                if cells[current + offsets[next_direction]] not in BLOCKED_CELLS:
+                    break
+            cost += 1 if next_direction == direction else 1001
+            direction = next_direction
+            current += offsets[direction]
+            tiles.append(current)
+        return Corridor(exit_direction, encode_state(current, direction), cost, tuple(tiles))
+
+    def with_stops(self, *indices: int) -> ChainMap:
+        """
+        Adds stop cells for one query, e.g. a start or end point in the middle of a corridor.
+        The compressed graph itself is left unchanged, so it can be reused for other queries.
+
+        Args:
+            indices: The cell indices that must be stop cells.
+
+        Returns:
+            The corridors of every stop cell, including the added ones and the corridors that lead into them.
+        """
+        extra_stops = set(indices) - self.stop_cells
+        if not extra_stops:
+            return ChainMap(self.corridors)
+
+        def is_stop(index: int) -> bool:
+            return index in self.stop_cells or index in extra_stops
+
+        extra_corridors = {}
+        for index in extra_stops:
+            extra_corridors[index] = self._walk_corridors(index, is_stop)
+        for index in extra_stops:
+            for corridor in extra_corridors[index]:
+                # Walk back from the stop cell at the other end, the corridor into `index` starts there.
+                other_index, arrival_direction = decode_state(corridor.end)
+                if other_index in extra_stops:
+                    continue  # already walked from that side
+                into_index = self._walk(other_index, (arrival_direction + 2) % 4, is_stop)
+                extra_corridors.setdefault(other_index, list(self.corridors[other_index])).append(into_index)
+        return ChainMap(extra_corridors, self.corridors)
+
+
+def get_neighbor_function(corridors: ChainMap):
     """
-    Finds all shortest paths from the `start_node` to any graph node whose
-    Point component matches the `end_point` in the grid. It leverages
-    Dijkstra's algorithm and a backtracking step.
+    Creates the neighbor function of the compressed maze for the search engine (aoc.search).
 
     Args:
-        graph: The graph (adjacency list) containing all (Point, Direction) nodes.
-        start_node: The initial node (Point and initial direction).
-        end_point: The target Point (destination grid location).
+        corridors: The corridors of every stop cell, see `CorridorGraph.with_stops`.
 
     Returns:
-        A tuple containing:
-            - all_paths: A list of lists, where each inner list represents one
-                         shortest path as a sequence of Nodes.
-            - lowest_cost: The minimum numerical cost to reach the `end_point`,
-                           or `None` if no path exists.
+        A function that maps an encoded node (stop cell index, direction) to a list of
+        (neighbor_node, weight) pairs.
     """
-    # First, run Dijkstra's to get the shortest path costs to all nodes
-    # and a record of all predecessors that lead to those shortest paths.
-    path_costs_for_each_node, predecessors = do_dijkstra(graph, start_node)
 
-    # Filter for all nodes that are at the `end_point` location and map them to their costs.
-    end_nodes_to_cost_dict = {node: cost for node, cost in path_costs_for_each_node.items() if node.p == end_point}
-    # If no paths were found to the end_point, or the lowest cost is still infinity, return empty.
-    if not end_nodes_to_cost_dict or min(end_nodes_to_cost_dict.values()) == float('inf'):
-        return [], None  # No path found
+    def neighbors(current_node: int) -> list[tuple[int, int]]:
+        current_index, current_direction = decode_state(current_node)
+        result = []
+        for corridor in corridors[current_index]:
+            # Calculate the weight for the edge. The corridor cost already holds the steps and the turns
+            # inside the corridor, plus a penalty for turning into it. The penalty is 1000 per 90-degree turn.
+            # `min(abs(corridor.exit - current_direction), 4 - abs(corridor.exit - current_direction))`
+            # calculates the minimum angular difference (e.g., 0 for straight,
+            # 1 for 90 degrees, 2 for 180 degrees).
+            weight_multiplicator = min(abs(corridor.exit - current_direction), 4 - abs(corridor.exit - current_direction))
+            result.append((corridor.end, corridor.cost + (1000 * weight_multiplicator)))
+        return result
 
-    lowest_cost = min(end_nodes_to_cost_dict.values())
-    # Identify all specific (Point, Direction) end nodes that achieve this `lowest_cost`.
-    # There might be multiple such nodes if arriving at the end_point from different
-    # directions results in the same minimum total cost.
-    end_nodes = [node for node, cost in end_nodes_to_cost_dict.items() if cost == lowest_cost]
+    return neighbors
 
-    all_paths = []
 
-    # For each identified `end_node`, reconstruct all paths back to the `start_node`.
-    for end_node in end_nodes:
-        backtrack([end_node], all_paths, start_node, predecessors)
+def get_corridor(corridors: ChainMap, node1: int, node2: int) -> Corridor:
+    """Returns the corridor that leads from the stop cell of `node1` to `node2`."""
+    return next(corridor for corridor in corridors[decode_state(node1)[0]] if corridor.end == node2)
 
-    return all_paths, lowest_cost
-    
 
-def backtrack(current_path: list, all_paths: list, start_node: Node, predecessors: dict):
+def get_tiles_on_shortest_paths(corridors: ChainMap, result: search.SearchResult) -> set:
+    """
+    Collects the cell indices of all tiles on any shortest path: the start cell and
+    the tiles of every corridor in the predecessor DAG of the search.
+    """
+    if not result.goals:
+        return set()
+    tiles = set()
+    for node in search.shortest_path_states(result):
+        node_predecessors = result.predecessors[node]
+        if not node_predecessors:  # the start node
+            tiles.add(decode_state(node)[0])
+        for predecessor in node_predecessors:
+            tiles.update(get_corridor(corridors, predecessor, node).tiles)
+    return tiles
+
+
+def find_shortest_paths(corridors: ChainMap, start_node: int, end_index: int) -> search.SearchResult:
     """
-    Recursively reconstructs all shortest paths from an `end_node` back to the
-    `start_node` using the `predecessors` dictionary generated by Dijkstra's algorithm.
+    Finds all shortest paths from the `start_node` to any graph node whose
+    cell index matches the `end_index` in the grid with Dijkstra's algorithm.
+    The paths are not built, the result keeps all predecessors on shortest paths instead.
+    They form a DAG that aoc.search walks to get the tiles on any shortest path or the number of paths.
 
     Args:
-        current_path: The path being built during the current recursive call.
-                      It starts with the `end_node` and grows backward.
-        all_paths: A list that accumulates all fully reconstructed shortest paths.
-        start_node: The designated starting node of the overall path.
-        predecessors: The dictionary mapping nodes to a list of their predecessors
-                      on shortest paths, as returned by `do_dijkstra`.
-    """
-    last_node = current_path[0] # The most recently added node to the current_path (which is the farthest from start)
-    if last_node == start_node:
-        all_paths.append(current_path) # Base case: If we reached the start node, a full path is found.
-        return
+        corridors: The corridors of the compressed maze, with the start and end cell as stop cells.
+        start_node: The initial encoded node (cell index and initial direction).
+        end_index: The target cell index (destination grid location).
 
-    if last_node not in predecessors: # Safety check: If a node has no predecessors, it's an isolated part or error.
-        return
+    Returns:
+        The search result. `goals` are all specific (cell index, direction) end nodes that achieve
+        the lowest cost `cost`; there might be multiple such nodes if arriving at the end_point from
+        different directions results in the same minimum total cost. Both are empty/`None` if no path exists.
+    """
+    # The search stops once no cheaper end node can follow.
+    with instrumentation.timer('dijkstra'):
+        return search.dijkstra(
+            start_node, get_neighbor_function(corridors), is_goal=lambda node: decode_state(node)[0] == end_index, all_predecessors=True
+        )
 
-    # For each predecessor of the `last_node`, recursively call backtrack to extend the path.
-    for predecessor in predecessors[last_node]:
-        backtrack([predecessor] + current_path, all_paths, start_node, predecessors)
-    
 
 def main() -> None:
     """
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 16
     logger.info('🎄 Running puzzle day 16...')
@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 import logging
 
-from aocd.models import Puzzle
-
+from aoc import instrumentation, tracing
 from shared import utils
 from shared.logger import logger
 
@@ -47,15 +46,20 @@ class ThreeBitComputer:
         self._register_c = register_c        
                
     def run_program(self) -> None:
+        instructions = 0
         while self._instruction_pointer < len(self._program):
             self._opcode = self._program[self._instruction_pointer]
             self._operand = self._program[self._instruction_pointer + 1]
             self._instruction_pointer += 2
             self._execute_instruction[self._opcode]()
-        # logger.debug('Program terminated')
-        # logger.debug(f'register A: {self._register_a}')
-        # logger.debug(f'register B: {self._register_b}')
-        # logger.debug(f'register C: {self._register_c}')
+            instructions += 1
+        if instrumentation.enabled():
+            instrumentation.count('computer.programs_run')
+            instrumentation.count('computer.instructions_executed', instructions)
+        # tracing.trace('Program terminated')
+        # tracing.trace('register A: %s', self._register_a)
+        # tracing.trace('register B: %s', self._register_b)
+        # tracing.trace('register C: %s', self._register_c)
 
     def _set_combo_operand_value(self):
         if  0 <= self._operand <= 3:
@@ -112,10 +116,10 @@ def parse_input(input_data: str) -> tuple[list,int, int, int]:
     program = program.split(': ')[1]
     program = [int(x) for x in program.split(',')]
     
-    logger.debug(f'initial register A: {a}')
-    logger.debug(f'initial register B: {b}')
-    logger.debug(f'initial register C: {c}')
-    logger.debug(f'initial program: {program}')
+    tracing.trace('initial register A: %s', a)
+    tracing.trace('initial register B: %s', b)
+    tracing.trace('initial register C: %s', c)
+    tracing.trace('initial program: %s', program)
     if not (a is not None and b is not None and c is not None and program):
         raise ValueError('Invalid input')
     
@@ -142,12 +146,14 @@ def solve_part_b(input_data: str) -> str:
     # INFO: old 'try' which helped to recognize a pattern
     computer = ThreeBitComputer(program)
     program_str = ','.join([str(x) for x in program])
+    debug = tracing.enabled()
     while computer.get_output() != program_str:
         a = a + 1
         computer.reboot(register_a=a)
         computer.run_program()
-        logger.debug(f"Trying a={a}, Output: {computer.get_output()}")
-    logger.debug(f"Found a={a} with output: {computer.get_output()}")    
+        if debug:
+            tracing.trace('Trying a=%s, Output: %s', a, computer.get_output())
+    tracing.trace('Found a=%s with output: %s', a, tracing.Lazy(computer.get_output))
     return str(a)
 
 
@@ -156,6 +162,8 @@ def main() -> None:
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 17
     logger.info('🎄 Running puzzle day 17...')
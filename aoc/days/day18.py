@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import logging
+from array import array
 from heapq import heapify, heappop, heappush
 
-from aocd.models import Puzzle
-
+from aoc import instrumentation, search, tracing
+from aoc.disjoint_set import DisjointSet
+from aoc.grid import FlatGrid
 from shared import utils
 from shared.logger import logger
 from shared.utils import Point
@@ -17,89 +19,237 @@ SUBMIT = True
 # logger.setLevel(logging.DEBUG)
 # EXAMPLE_DATA = True
 
-def solve_part_a(input_data: str) -> str:
-    start_point = Point(0, 0)
-    row_col_length = 6 if EXAMPLE_DATA else 70
-    end_point = Point(row_col_length, row_col_length)
-    grid_string = '\n'.join(['.' * (row_col_length+1) for _ in range(row_col_length+1)])
-    grid = utils.Grid(grid_string)
-    corrupted_points_set = fill_grid_with_corruptions(input_data, grid, 12 if EXAMPLE_DATA else 1024)
-    graph = {}
-    add_all_edges_to_graph(graph, grid, start_point, corrupted_points_set)
-    logger.debug(f'Graph has {len(graph)} points')
-    all_shortest_paths, cost = utils.Graph.get_shortest_paths(graph, start_point, end_point)
-    logger.debug(f'Found {len(all_shortest_paths)} shortest paths with cost {cost}')
+# Byte value of a memory cell that is not corrupted, bytes outside the memory space are OUTSIDE cells of the grid.
+FREE = ord('.')
+
+
+def solve_part_a(input_data: str, size: int | None = None, corruptions: int | None = None) -> str:
+    """
+    `size` is the side length of the memory space and `corruptions` the number of fallen bytes,
+    both default to the puzzle (or example) values.
+    """
+    grid, start_index, end_index = create_memory_space(size)
+    if corruptions is None:
+        corruptions = 12 if EXAMPLE_DATA else 1024
+    fill_grid_with_corruptions(input_data, grid, corruptions)
+    # only the distance is needed, the path just for the visualization
+    with instrumentation.timer('shortest_paths'):
+        distance, path = search.bidirectional_bfs(
+            (start_index,), (end_index,), get_neighbor_function(grid), with_path=tracing.enabled()
+        )
+    if instrumentation.enabled():
+        instrumentation.count('shortest_paths.searches')
+    tracing.trace('Shortest path costs %s', distance)
 
     # grid[Point(0, 0)] = f'\033[39m{grid[Point(0, 0)]}'  # Reset color for the first char
-    for _shortest_path in all_shortest_paths: # Ensure there is at least one path
-        _grid = grid.copy()
-        for p in _shortest_path: # Exclude start and end for clear visualization
-            _grid[p] = '\033[31mO\033[39m'  # color path red
-        logger.debug(_grid) # Log the colored grid
-    return str(cost)
-
-
-def solve_part_b(input_data: str) -> str:
-    # TODO: that is neither fast nor pretty
-    start_point = Point(0, 0)
-    row_col_length = 6 if EXAMPLE_DATA else 70
-    end_point = Point(row_col_length, row_col_length)
-    grid_string = '\n'.join(['.' * (row_col_length+1) for _ in range(row_col_length+1)])
-    corruptions = 12 if EXAMPLE_DATA else 1024
-    grid = utils.Grid(grid_string)
-    corrupted_points_set = fill_grid_with_corruptions(input_data, grid, corruptions)
-    for i, line in enumerate(input_data.split('\n')):
-        if i < corruptions:
-            continue
-        x, y = line.split(',')
-        p = Point(int(y), int(x))
-        corrupted_points_set.add(p)
-        graph = {}
-        add_all_edges_to_graph(graph, grid, start_point, corrupted_points_set)
-        all_shortest_paths, cost = utils.Graph.get_shortest_paths(graph, start_point, end_point)
-        if not all_shortest_paths:
-            return str(f'{x},{y}')
+    if path:
+        _grid = utils.Grid(str(grid))  # a utils.Grid cell can hold the color codes
+        for index in grid.shortest_path_cells(start_index, end_index):
+            _grid[grid.point(index)] = '\033[33mo\033[39m'  # color the tiles on any shortest path yellow
+        for index in path:
+            _grid[grid.point(index)] = '\033[31mO\033[39m'  # color path red
+        tracing.trace('%s', _grid) # Log the colored grid
+    return str(distance)
 
-    return str('Not solved')
 
+def solve_part_b(input_data: str, size: int | None = None) -> str:
+    """
+    `size` is the side length of the memory space, it defaults to the puzzle (or example) value.
+    """
+    grid, start_index, end_index = create_memory_space(size)
+    lines = [line for line in input_data.split('\n') if line]
+    corrupted_cells = [grid.index(Point(int(y), int(x))) for x, y in (line.split(',') for line in lines)]
+    with instrumentation.timer('union_find'):
+        i = find_first_blocking_byte(grid, corrupted_cells, start_index, end_index)
+    if i is None:
+        return str('Not solved')
+    if tracing.enabled():
+        distances = get_distances_over_time(grid, corrupted_cells[:i + 1], start_index, end_index)
+        tracing.trace('Shortest path costs after each byte: %s', distances)
+    return str(lines[i])
 
-def fill_grid_with_corruptions(input_data: str, grid: utils.Grid, corruptions: int) -> set:
-    corrupted_points_set = set()
+
+def create_memory_space(size: int | None = None) -> tuple[FlatGrid, int, int]:
+    """the empty memory space of `size` x `size` cells (default: 7 for the example, 71 for the puzzle), start and end"""
+    if size is None:
+        size = 7 if EXAMPLE_DATA else 71
+    grid = FlatGrid.filled(size, size, '.')
+    return grid, grid.index(Point(0, 0)), grid.index(Point(size - 1, size - 1))
+
+
+def fill_grid_with_corruptions(input_data: str, grid: FlatGrid, corruptions: int) -> None:
     for i, line in enumerate(input_data.split('\n')):
         if i == corruptions:
             break
         x, y = line.split(',')
-        p = Point(int(y), int(x))
-        corrupted_points_set.add(p)
-        grid[p] = '#'
-    logger.debug(grid)
-    return corrupted_points_set
+        grid[Point(int(y), int(x))] = '#'
+    tracing.trace('%s', grid)
+    return None
 
 
-def add_all_edges_to_graph(graph: dict, grid: utils.Grid, start_point: Point, corrupted_points_set: set) -> None:
-    visited_points_set = set()
-    points_to_visit = [start_point]
+def find_first_blocking_byte(grid: FlatGrid, corrupted_cells: list[int], start_index: int, end_index: int) -> int | None:
+    """
+    Index of the first falling byte after which the end can't be reached from the start anymore, None if it always can.
+    Works backwards with union-find: all bytes are dropped onto a copy of the grid first, then they are removed again
+    from the last one on and every freed cell is merged with its free neighbors. The first byte in that reverse order
+    that connects start and end is the one that blocked the way. Every cell is merged a constant number of times,
+    so this stays near-linear in the number of cells and bytes, instead of a search per byte.
+    """
+    cells = grid.cells.copy()
+    repeated = set()  # bytes that fall onto a corrupted cell, the cell only becomes free again with the first one
+    for i, index in enumerate(corrupted_cells):
+        if cells[index] != FREE:
+            repeated.add(i)
+        cells[index] = ord('#')
+
+    disjoint_set = DisjointSet(len(cells))
+    for index, value in enumerate(cells):
+        if value == FREE:
+            # right and down are enough, every pair of free neighbors is merged once
+            for next_index in (index + 1, index + grid.stride):
+                if cells[next_index] == FREE:
+                    disjoint_set.union(index, next_index)
+    if disjoint_set.connected(start_index, end_index):
+        return None
 
-    while points_to_visit:
-        current_point = points_to_visit.pop()
-        if current_point in visited_points_set:
+    offsets = [grid.offset(direction) for direction in utils.STRAIGHT_DIRECTIONS.values()]
+    for i in reversed(range(len(corrupted_cells))):
+        if i in repeated:
             continue
-        visited_points_set.add(current_point)
-        
-        for neighbor_point in grid.get_neighbors(current_point):
-            if neighbor_point in corrupted_points_set:
-                continue            
-            weight = 1            
-            utils.Graph.add_edge(graph, current_point, neighbor_point, weight)
-            points_to_visit.append(neighbor_point)
+        index = corrupted_cells[i]
+        cells[index] = FREE
+        for offset in offsets:
+            if cells[index + offset] == FREE:
+                disjoint_set.union(index, index + offset)
+        if disjoint_set.connected(start_index, end_index):
+            tracing.trace('Byte %s blocks the way', i)
+            return i
     return None
 
 
+class IncrementalShortestPath:
+    """
+    Keeps the shortest path from start to end up to date while memory cells get corrupted one by one.
+
+    The BFS layers (cells grouped by their distance from the start) are kept between the corruptions.
+    A corrupted cell that is not on the current path can't make the path longer, so nothing is searched.
+    Otherwise the BFS is repaired from the layer of the cell on: the distances of all cells in earlier layers can't
+    change, and every path to a later cell passes a free cell of that layer. A corruption off the path may still
+    change the distances behind it, so its layer is remembered and the next repair starts there if it is earlier.
+    """
+
+    def __init__(self, grid: FlatGrid, start_index: int, end_index: int):
+        self._cells = grid.cells
+        self._offsets = [grid.offset(direction) for direction in utils.STRAIGHT_DIRECTIONS.values()]
+        self._end_index = end_index
+        self._distances = array('q', [-1]) * len(self._cells)
+        self._distances[start_index] = 0
+        self._layers = [[start_index] if self._cells[start_index] == FREE else []]
+        self._dirty_layer = None  # earliest layer with a corruption that was not repaired yet
+        self._path = set()
+        self.distance = None
+        self._search()
+
+    def corrupt(self, index: int) -> int | None:
+        """corrupt the cell and return the new length of the shortest path, None if the end can't be reached"""
+        self._cells[index] = ord('#')
+        layer = self._distances[index]
+        if self.distance is None or layer == -1:
+            return self.distance
+        if index not in self._path:
+            if self._dirty_layer is None or layer < self._dirty_layer:
+                self._dirty_layer = layer
+            return self.distance
+        if self._dirty_layer is not None and self._dirty_layer < layer:
+            layer = self._dirty_layer
+        self._dirty_layer = None
+
+        for later_layer in self._layers[layer + 1:]:
+            for later_index in later_layer:
+                self._distances[later_index] = -1
+        del self._layers[layer + 1:]
+        self._layers[layer] = [i for i in self._layers[layer] if self._cells[i] == FREE]
+        self._distances[self._end_index] = -1
+        if instrumentation.enabled():
+            instrumentation.count('incremental_paths.repairs')
+        self._search()
+        return self.distance
+
+    def _search(self) -> None:
+        """continue the BFS from the last layer until the end is reached or no cell is left"""
+        cells = self._cells
+        offsets = self._offsets
+        distances = self._distances
+        layer = self._layers[-1]
+        distance = len(self._layers) - 1
+        cells_visited = 0
+        while layer and distances[self._end_index] == -1:
+            distance += 1
+            next_layer = []
+            for index in layer:
+                for offset in offsets:
+                    next_index = index + offset
+                    if cells[next_index] == FREE and distances[next_index] == -1:
+                        distances[next_index] = distance
+                        next_layer.append(next_index)
+            cells_visited += len(layer)
+            self._layers.append(next_layer)
+            layer = next_layer
+        if instrumentation.enabled():
+            instrumentation.count('incremental_paths.cells_visited', cells_visited)
+
+        self._path.clear()
+        if distances[self._end_index] == -1:
+            self.distance = None
+            return None
+        self.distance = distances[self._end_index]
+        # walk back through cells that are one step closer to the start
+        index = self._end_index
+        self._path.add(index)
+        for distance in range(self.distance - 1, -1, -1):
+            index = next(
+                index + offset for offset in offsets
+                if cells[index + offset] == FREE and distances[index + offset] == distance
+            )
+            self._path.add(index)
+        return None
+
+
+def get_distances_over_time(
+    grid: FlatGrid, corrupted_cells: list[int], start_index: int, end_index: int
+) -> list[int | None]:
+    """
+    length of the shortest path after each of the corrupted cells, None once the end can't be reached anymore.
+    The grid is left unchanged.
+    """
+    grid = grid.copy()
+    with instrumentation.timer('incremental_paths'):
+        shortest_path = IncrementalShortestPath(grid, start_index, end_index)
+        return [shortest_path.corrupt(index) for index in corrupted_cells]
+
+
+def get_neighbor_function(grid: FlatGrid):
+    """
+    neighbor function for the search engine (aoc.search): nodes are the cell indices of the flat grid,
+    corrupted cells and the border around the memory space are skipped.
+    It reads the grid on every call, so later corruptions are taken into account.
+    """
+    cells = grid.cells
+    offsets = [grid.offset(direction) for direction in utils.STRAIGHT_DIRECTIONS.values()]
+
+    def neighbors(index: int) -> list[int]:
+        return [index + offset for offset in offsets if cells[index + offset] == FREE]
+
+    return neighbors
+
+
 def main() -> None:
     """
     Execute the solve functions for each part and submit the solution for the specified year and day
     This is part of the template and does not need to be changed
     """
+    from aocd.models import Puzzle
+
     year = 2024
     day = 18
     logger.info('🎄 Running puzzle day 18...')
@@ -0,0 +1,40 @@
+from array import array
+
+# Union-find over the elements 0 .. size-1, e.g. the cell indices of a FlatGrid.
+# Parents and sizes live in two flat int arrays instead of dicts, a grid with millions of cells costs 16 bytes per cell.
+# Union by size plus path halving keep every operation close to constant time.
+# Union-find can only merge, so connectivity that is lost over time is answered by replaying the changes backwards:
+# start from the final state and undo them one by one, every undo merges (see day18).
+
+
+class DisjointSet:
+    """
+    disjoint sets of the ints 0 .. size-1, every element starts in a set of its own
+    """
+
+    def __init__(self, size: int):
+        self.parents = array('q', range(size))
+        self.sizes = array('q', [1]) * size
+
+    def find(self, element: int) -> int:
+        """representative of the set of `element`"""
+        parents = self.parents
+        while parents[element] != element:
+            parents[element] = parents[parents[element]]  # path halving
+            element = parents[element]
+        return element
+
+    def union(self, element1: int, element2: int) -> bool:
+        """merge the sets of both elements, False if they already were in the same set"""
+        root1 = self.find(element1)
+        root2 = self.find(element2)
+        if root1 == root2:
+            return False
+        if self.sizes[root1] < self.sizes[root2]:
+            root1, root2 = root2, root1
+        self.parents[root2] = root1
+        self.sizes[root1] += self.sizes[root2]
+        return True
+
+    def connected(self, element1: int, element2: int) -> bool:
+        return self.find(element1) == self.find(element2)
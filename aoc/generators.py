@@ -0,0 +1,267 @@
+import math
+import random
+import string
+from collections import namedtuple
+
+# Synthetic puzzle inputs for stress testing the solvers.
+# Every generator takes a `scale` and a `seed` and returns an input string in the format of the real puzzle input.
+# Scale 1 is roughly the size of a real input, scale 10 has about ten times as many lines, cells, robots, ...
+# Grids grow by sqrt(scale) per side, so their area grows with the scale.
+# `parts` are the parts that terminate on synthetic data, e.g. day 14 part B searches for a picture that random robots never draw.
+# `options` maps the scale to keyword arguments for the solve functions, for days whose dimensions are not part of the input.
+Generator = namedtuple('Generator', ('generate', 'parts', 'options'), defaults=(None,))
+
+
+def __side(base: int, scale: int) -> int:
+    return max(round(base * math.sqrt(scale)), 2)
+
+
+def generate_day01(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return '\n'.join(f'{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}' for _ in range(1000 * scale))
+
+
+def generate_day02(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(1000 * scale):
+        direction = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        if rng.random() < 0.5:  # break about half of the reports
+            levels[rng.randrange(len(levels))] += rng.choice((-4, 0, 4))
+        lines.append(' '.join(str(level) for level in levels))
+    return '\n'.join(lines)
+
+
+def generate_day03(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    chunks = []
+    length = 0
+    while length < 18000 * scale:
+        roll = rng.random()
+        if roll < 0.3:
+            chunk = f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})'
+        elif roll < 0.35:
+            chunk = 'do()'
+        elif roll < 0.4:
+            chunk = "don't()"
+        else:
+            chunk = ''.join(rng.choice('mul(),[]{}@#$%^&*!?<>:;\' ') for _ in range(rng.randint(1, 8)))
+        chunks.append(chunk)
+        length += len(chunk)
+    return ''.join(chunks)
+
+
+def generate_day04(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = __side(140, scale)
+    return '\n'.join(''.join(rng.choice('XMAS') for _ in range(side)) for _ in range(side))
+
+
+def generate_day05(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    pages = rng.sample(range(10, 100), 49)  # the order of this list is the order all rules agree on
+    rules = [f'{x}|{y}' for i, x in enumerate(pages) for y in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(200 * scale):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(str(page) for page in update))
+    return '\n'.join(rules) + '\n\n' + '\n'.join(updates)
+
+
+def __guard_leaves(rows: list[list[str]], y: int, x: int) -> bool:
+    """walk the guard like day 06 does and check that it leaves the map instead of looping"""
+    dy, dx = -1, 0
+    seen = set()
+    while True:
+        if (y, x, dy, dx) in seen:
+            return False
+        seen.add((y, x, dy, dx))
+        next_y, next_x = y + dy, x + dx
+        if not (0 <= next_y < len(rows) and 0 <= next_x < len(rows[0])):
+            return True
+        if rows[next_y][next_x] == '#':
+            dy, dx = dx, -dy
+        else:
+            y, x = next_y, next_x
+
+
+def generate_day06(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = __side(130, scale)
+    while True:
+        rows = [['#' if rng.random() < 0.05 else '.' for _ in range(side)] for _ in range(side)]
+        y, x = side // 2, side // 2
+        rows[y][x] = '^'
+        if __guard_leaves(rows, y, x):
+            return '\n'.join(''.join(row) for row in rows)
+
+
+def generate_day07(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(850 * scale):
+        numbers = [rng.randint(1, 999)] + [rng.randint(1, 20) for _ in range(rng.randint(2, 11))]
+        result = numbers[0]
+        for number in numbers[1:]:
+            result = rng.choice((result + number, result * number, int(f'{result}{number}')))
+        if rng.random() < 0.5:  # about half of the equations cannot be solved
+            result += rng.randint(1, 9)
+        lines.append(f'{result}: {" ".join(str(number) for number in numbers)}')
+    return '\n'.join(lines)
+
+
+def generate_day08(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = __side(50, scale)
+    frequencies = string.digits + string.ascii_letters
+    return '\n'.join(''.join(rng.choice(frequencies) if rng.random() < 0.06 else '.' for _ in range(side)) for _ in range(side))
+
+
+def generate_day09(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    length = 19999 * scale  # odd, the disk map starts and ends with a file
+    return ''.join(str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9)) for i in range(length))
+
+
+def generate_day10(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = __side(45, scale)
+    return '\n'.join(
+        ''.join(str(rng.randint(0, 9)) if rng.random() < 0.2 else str((y + x) % 10) for x in range(side))
+        for y in range(side)
+    )
+
+
+def generate_day11(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return ' '.join(str(rng.randint(0, 9999999)) for _ in range(8 * scale))
+
+
+def generate_day13(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    machines = []
+    for _ in range(320 * scale):
+        a_x, a_y, b_x, b_y = (rng.randint(10, 99) for _ in range(4))
+        while a_x * b_y == a_y * b_x:  # the real buttons are never parallel
+            b_y = rng.randint(10, 99)
+        if rng.random() < 0.5:
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            prize_x, prize_y = a * a_x + b * b_x, a * a_y + b * b_y
+        else:
+            prize_x, prize_y = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(
+            f'Button A: X+{a_x}, Y+{a_y}\nButton B: X+{b_x}, Y+{b_y}\nPrize: X={prize_x}, Y={prize_y}'
+        )
+    return '\n\n'.join(machines)
+
+
+def generate_day14(scale: int, seed: int = 0) -> str:
+    """robots on an area that grows with the scale, see `options_day14`"""
+    rng = random.Random(seed)
+    options = options_day14(scale)
+    return '\n'.join(
+        f'p={rng.randrange(options["columns"])},{rng.randrange(options["rows"])} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}'
+        for _ in range(500 * scale)
+    )
+
+
+def options_day14(scale: int) -> dict:
+    return {'columns': __side(101, scale) | 1, 'rows': __side(103, scale) | 1}  # odd, so there is a middle line
+
+
+def generate_day15(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = __side(50, scale)
+    rows = []
+    for y in range(side):
+        row = []
+        for x in range(side):
+            if y in (0, side - 1) or x in (0, side - 1) or rng.random() < 0.08:
+                row.append('#')
+            else:
+                row.append('O' if rng.random() < 0.35 else '.')
+        rows.append(row)
+    rows[side // 2][side // 2] = '@'
+    movements = ''.join(rng.choice('<>^v') for _ in range(20000 * scale))
+    movement_lines = [movements[i:i + 1000] for i in range(0, len(movements), 1000)]
+    return '\n'.join(''.join(row) for row in rows) + '\n\n' + '\n'.join(movement_lines)
+
+
+def generate_day16(scale: int, seed: int = 0) -> str:
+    """a maze carved by a randomized depth-first search with some extra openings, like the real mazes have"""
+    rng = random.Random(seed)
+    side = __side(141, scale) | 1  # odd, so the outer wall and the cells line up
+    rows = [['#'] * side for _ in range(side)]
+    start = (side - 2, 1)
+    rows[start[0]][start[1]] = '.'
+    stack = [start]
+    while stack:
+        y, x = stack[-1]
+        neighbors = [(y + dy, x + dx, dy, dx) for dy, dx in ((0, 2), (0, -2), (2, 0), (-2, 0))
+                     if 0 < y + dy < side - 1 and 0 < x + dx < side - 1 and rows[y + dy][x + dx] == '#']
+        if not neighbors:
+            stack.pop()
+            continue
+        next_y, next_x, dy, dx = rng.choice(neighbors)
+        rows[y + dy // 2][x + dx // 2] = '.'
+        rows[next_y][next_x] = '.'
+        stack.append((next_y, next_x))
+    for _ in range(side * side // 40):  # open some walls between two cells to create loops
+        y, x = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (y % 2) != (x % 2):
+            rows[y][x] = '.'
+    rows[start[0]][start[1]] = 'S'
+    rows[1][side - 2] = 'E'
+    return '\n'.join(''.join(row) for row in rows)
+
+
+def generate_day17(scale: int, seed: int = 0) -> str:
+    """a program shaped like the real ones: it outputs one value per 3 bits of register A"""
+    rng = random.Random(seed)
+    program = [2, 4, 1, rng.randrange(8), 7, 5, 1, rng.randrange(8), 4, rng.randrange(8), 0, 3, 5, 5, 3, 0]
+    register_a = rng.randrange(8 ** (16 * scale - 1), 8 ** (16 * scale))
+    return f'Register A: {register_a}\nRegister B: 0\nRegister C: 0\n\nProgram: {",".join(str(x) for x in program)}'
+
+
+def generate_day18(scale: int, seed: int = 0) -> str:
+    """
+    falling bytes on a memory space that grows with the scale, see `options_day18`.
+    Like in the puzzle, about 70% of the cells get corrupted, the start and the exit never.
+    """
+    rng = random.Random(seed)
+    size = options_day18(scale)['size']
+    cells = [(x, y) for y in range(size) for x in range(size) if (x, y) not in ((0, 0), (size - 1, size - 1))]
+    rng.shuffle(cells)
+    return '\n'.join(f'{x},{y}' for x, y in cells[:len(cells) * 7 // 10])
+
+
+def options_day18(scale: int) -> dict:
+    size = __side(71, scale)
+    return {'size': size, 'corruptions': size * size * 1024 // (71 * 71)}  # 1024 bytes on the 71x71 puzzle memory space
+
+
+GENERATORS = {
+    1: Generator(generate_day01, ('a', 'b')),
+    2: Generator(generate_day02, ('a', 'b')),
+    3: Generator(generate_day03, ('a', 'b')),
+    4: Generator(generate_day04, ('a', 'b')),
+    5: Generator(generate_day05, ('a', 'b')),
+    6: Generator(generate_day06, ('a', 'b')),
+    7: Generator(generate_day07, ('a', 'b')),
+    8: Generator(generate_day08, ('a', 'b')),
+    9: Generator(generate_day09, ('a', 'b')),
+    10: Generator(generate_day10, ('a', 'b')),
+    11: Generator(generate_day11, ('a', 'b')),
+    13: Generator(generate_day13, ('a', 'b')),
+    14: Generator(generate_day14, ('a',), options_day14),
+    15: Generator(generate_day15, ('a', 'b')),
+    16: Generator(generate_day16, ('a', 'b')),
+    17: Generator(generate_day17, ('a',)),  # part B is a brute force search
+    18: Generator(generate_day18, ('a', 'b'), options_day18),
+}
@@ -0,0 +1,202 @@
+from array import array
+from collections import OrderedDict, deque
+from typing import Iterator
+
+from shared import utils
+from shared.utils import Point
+
+OUTSIDE = ' '  # sentinel value of the border cells around the grid
+DIRECTION_BITS = 2  # room for the four straight directions in an encoded state
+DISTANCE_FIELD_CACHE_SIZE = 8  # distance fields kept per grid, each one takes 8 bytes per cell
+
+
+def encode_state(key: int, direction: int) -> int:
+    """
+    pack a cell index and a direction 0-3 into a single int.
+    Sets and dicts of ints need a fraction of the memory of (Point, direction) tuples and hash faster.
+    """
+    return key << DIRECTION_BITS | direction
+
+
+def decode_state(state: int) -> tuple[int, int]:
+    return state >> DIRECTION_BITS, state & ((1 << DIRECTION_BITS) - 1)
+
+
+class FlatGrid:
+    """
+    Grid of single byte (ASCII) cells stored row by row in one flat bytearray.
+    The grid is surrounded by `padding` rows and columns of OUTSIDE cells, so a walk that checks the cell it moves to
+    never needs a bounds check: it stops at the sentinel instead of running off the grid.
+    Cells are addressed by their index, moving into a direction is adding its `offset`.
+
+    The Point based API of utils.Grid (iteration, grid[p], in_bounds, get_neighbors, copy, str) works as well,
+    so a FlatGrid can replace a utils.Grid and the hot loops can switch to indices one at a time.
+    """
+
+    def __init__(self, input_data: str, padding: int = 1):
+        lines = [line for line in input_data.split('\n') if line]
+        self.height = len(lines)
+        self.width = len(lines[0]) if lines else 0
+        self.padding = padding
+        self.stride = self.width + 2 * padding
+        self.cells = bytearray(OUTSIDE.encode('ascii') * (self.stride * (self.height + 2 * padding)))
+        for y, line in enumerate(lines):
+            start = self.index(Point(y, 0))
+            self.cells[start:start + self.width] = line.encode('ascii')
+        self._generation = 0  # changes with every write through __setitem__ or invalidate()
+        self._distance_fields = OrderedDict()  # least recently used first
+        self._distance_fields_generation = 0
+
+    @classmethod
+    def filled(cls, height: int, width: int, value: str = '.', padding: int = 1) -> 'FlatGrid':
+        """
+        grid of `height` x `width` cells with `value`, built directly as bytes instead of parsing a joined string
+        """
+        grid = cls('', padding)
+        grid.height = height
+        grid.width = width
+        grid.stride = width + 2 * padding
+        border = OUTSIDE.encode('ascii')
+        row = border * padding + value.encode('ascii') * width + border * padding
+        padding_rows = border * (grid.stride * padding)
+        grid.cells = bytearray(padding_rows + row * height + padding_rows)
+        return grid
+
+    @classmethod
+    def from_buffer(cls, cells, height: int, width: int, padding: int = 1) -> 'FlatGrid':
+        """
+        grid on the `cells` of another grid without copying them, e.g. a memoryview of shared memory.
+        Cells, rows and columns can be read from any buffer, find, find_all and the distance fields need a bytearray.
+        """
+        grid = cls('', padding)
+        grid.height = height
+        grid.width = width
+        grid.stride = width + 2 * padding
+        grid.cells = cells
+        return grid
+
+    def index(self, p: Point) -> int:
+        return (p[0] + self.padding) * self.stride + p[1] + self.padding
+
+    def point(self, index: int) -> Point:
+        y, x = divmod(index, self.stride)
+        return Point(y - self.padding, x - self.padding)
+
+    def offset(self, direction: Point) -> int:
+        """index offset of a direction, e.g. grid.offset(utils.DIRECTIONS['up']) == -grid.stride"""
+        return direction[0] * self.stride + direction[1]
+
+    def in_bounds(self, p: Point) -> bool:
+        return 0 <= p[0] < self.height and 0 <= p[1] < self.width
+
+    def __getitem__(self, key: Point | int) -> str | None:
+        """the cell at an index or a Point, None for Points outside the grid"""
+        if isinstance(key, int):
+            return chr(self.cells[key])
+        if not self.in_bounds(key):
+            return None
+        return chr(self.cells[self.index(key)])
+
+    def __setitem__(self, key: Point | int, value: str) -> None:
+        index = key if isinstance(key, int) else self.index(key)
+        self.cells[index] = ord(value)
+        self._generation += 1
+
+    def invalidate(self) -> None:
+        """drop the cached distance fields, for code that writes to `cells` directly"""
+        self._generation += 1
+        return None
+
+    def __iter__(self) -> Iterator[tuple[Point, str]]:
+        for y in range(self.height):
+            row = self.row(y)
+            for x in range(self.width):
+                yield Point(y, x), row[x]
+
+    def __str__(self) -> str:
+        return '\n'.join(self.row(y) for y in range(self.height))
+
+    def copy(self) -> 'FlatGrid':
+        grid = FlatGrid.__new__(FlatGrid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = self.cells.copy()
+        grid._distance_fields = OrderedDict()
+        return grid
+
+    def row(self, y: int) -> str:
+        start = self.index(Point(y, 0))
+        return str(self.cells[start:start + self.width], 'ascii')
+
+    def column(self, x: int) -> str:
+        start = self.index(Point(0, x))
+        return bytes(self.cells[start:start + self.height * self.stride:self.stride]).decode('ascii')
+
+    def find(self, value: str) -> int:
+        """index of the first cell with `value`, -1 if there is none"""
+        return self.cells.find(ord(value))
+
+    def find_all(self, value: str) -> list[int]:
+        """indices of all cells with `value`, in row order"""
+        indices = []
+        target = ord(value)
+        index = self.cells.find(target)
+        while index != -1:
+            indices.append(index)
+            index = self.cells.find(target, index + 1)
+        return indices
+
+    def get_neighbors(self, p: Point) -> list[Point]:
+        return [p + d for d in utils.STRAIGHT_DIRECTIONS.values() if self.in_bounds(p + d)]
+
+    def distance_field(self, sources: tuple[int, ...], blocked: str = '#') -> array:
+        """
+        BFS distances from the nearest of the `sources` (cell indices) to every cell, -1 where it can't be reached.
+        The result is a flat array indexed like `cells`, so many distance questions on the same grid are lookups.
+        The DISTANCE_FIELD_CACHE_SIZE most recently used fields are kept until a cell is set through grid[...] = value.
+        Code that writes to `cells` directly has to call `invalidate` before it asks for a field again.
+        """
+        if self._distance_fields_generation != self._generation:
+            self._distance_fields.clear()
+            self._distance_fields_generation = self._generation
+        key = (sources, blocked)
+        field = self._distance_fields.get(key)
+        if field is not None:
+            self._distance_fields.move_to_end(key)
+            return field
+
+        cells = self.cells
+        blocked_cells = (blocked + OUTSIDE).encode('ascii')
+        offsets = (-self.stride, 1, self.stride, -1)
+        field = array('q', [-1]) * len(cells)
+        queue = deque()
+        for source in sources:
+            if cells[source] not in blocked_cells and field[source] == -1:
+                field[source] = 0
+                queue.append(source)
+        while queue:
+            index = queue.popleft()
+            next_distance = field[index] + 1
+            for offset in offsets:
+                next_index = index + offset
+                if field[next_index] == -1 and cells[next_index] not in blocked_cells:
+                    field[next_index] = next_distance
+                    queue.append(next_index)
+        if len(self._distance_fields) >= DISTANCE_FIELD_CACHE_SIZE:
+            self._distance_fields.popitem(last=False)  # the least recently used one
+        self._distance_fields[key] = field
+        return field
+
+    def shortest_path_cells(self, start: int, end: int, blocked: str = '#') -> list[int]:
+        """
+        indices of all cells on any shortest path from `start` to `end`, from the distance fields of both ends:
+        a cell is on one if its distance to the start plus its distance to the end is the shortest distance
+        """
+        from_start = self.distance_field((start,), blocked)
+        to_end = self.distance_field((end,), blocked)
+        best = from_start[end]
+        if best == -1:
+            return []
+        return [
+            index for index, (distance1, distance2) in enumerate(zip(from_start, to_end))
+            if distance1 != -1 and distance2 != -1 and distance1 + distance2 == best
+        ]
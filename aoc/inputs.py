@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+import argparse
+import mmap
+import os
+
+from shared.logger import logger
+
+YEAR = 2024
+# Directory with one dayNN.txt (and optionally dayNN.example.txt) per day, can be moved with AOC_INPUT_DIR
+INPUT_DIR = Path(os.environ.get('AOC_INPUT_DIR', Path(__file__).resolve().parent.parent / 'inputs'))
+MMAP_THRESHOLD = 1024 * 1024  # inputs of this size or larger are read through a memory map
+
+
+def is_offline() -> bool:
+    """
+    with AOC_OFFLINE set, inputs are only read from the store and aocd is never imported
+    """
+    return os.environ.get('AOC_OFFLINE', '') not in ('', '0')
+
+
+def get_input_path(day: int, example: bool = False, input_dir: Path | None = None) -> Path:
+    input_dir = input_dir or INPUT_DIR
+    return input_dir / (f'day{day:02}.example.txt' if example else f'day{day:02}.txt')
+
+
+def read_input(path: Path) -> str:
+    """
+    Read an input file from the store.
+    Big inputs are decoded straight from a memory map of the file: a plain read first copies the whole file into
+    a bytes object and then decodes that into the str, the map skips the bytes copy and halves the peak memory.
+    Trailing newlines are removed to match the input_data aocd returns, before decoding so the str isn't copied again.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return f.read().rstrip(b'\r\n').decode('utf-8')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            end = len(mapped)
+            while end and mapped[end - 1] in b'\r\n':
+                end -= 1
+            with memoryview(mapped) as view, view[:end] as data:
+                return str(data, 'utf-8')
+
+
+def fetch_input(day: int, example: bool = False) -> str:
+    """
+    get the input data from aocd, which uses its own cache and only hits the network when needed
+    """
+    from aocd.models import Puzzle
+
+    puzzle = Puzzle(year=YEAR, day=day)
+    if example:
+        return puzzle.examples[0].input_data
+    return puzzle.input_data
+
+
+def store_input(day: int, input_data: str, example: bool = False, input_dir: Path | None = None) -> Path:
+    path = get_input_path(day, example=example, input_dir=input_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(input_data)
+    return path
+
+
+def load_input(day: int, example: bool = False, input_dir: Path | None = None, fallback: bool = True) -> str:
+    """
+    Load the input of a day from the store.
+    When the file is missing and `fallback` is set, the input is fetched from aocd and added to the store.
+    Offline runs (AOC_OFFLINE) never fall back.
+    """
+    path = get_input_path(day, example=example, input_dir=input_dir)
+    if path.exists():
+        return read_input(path)
+    if not fallback or is_offline():
+        raise FileNotFoundError(f'No input for day {day:02} in {path.parent}, run inputs.py --sync {day} while online')
+
+    logger.info(f'📥 Day {day:02} not in the input store, fetching it from aocd...')
+    input_data = fetch_input(day, example=example)
+    store_input(day, input_data, example=example, input_dir=input_dir)
+    return input_data
+
+
+def sync_inputs(days: list[int], examples: bool = False, input_dir: Path | None = None) -> None:
+    """
+    copy the inputs (and examples) of the given days from aocd into the store
+    """
+    for day in days:
+        for example in (False, True) if examples else (False,):
+            try:
+                path = store_input(day, fetch_input(day, example=example), example=example, input_dir=input_dir)
+            except Exception as e:
+                logger.warning(f'❌ Day {day:02}{" example" if example else ""} could not be fetched: {e}')
+                continue
+            logger.info(f'💾 Day {day:02}{" example" if example else ""} stored in {path}')
+    return None
+
+
+def __parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Fill the local input store from aocd')
+    parser.add_argument('--sync', required=True, help='days to fetch, e.g. 1-18 or 1,3,5-7')
+    parser.add_argument('--examples', action='store_true', help='also store the first example of each day')
+    parser.add_argument('--input-dir', type=Path, default=None, help=f'store directory (default: {INPUT_DIR})')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    from aoc import batch
+
+    args = __parse_args(sys.argv[1:])
+    sync_inputs(batch.parse_day_selection(args.sync), examples=args.examples, input_dir=args.input_dir)
@@ -0,0 +1,74 @@
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Counters and timers for the hot paths of the solvers: nodes expanded, heap pushes, instructions executed, ...
+# They are off by default and switched on with AOC_COUNTERS=1 (the runner sets it for --counters).
+# Hot loops count into local variables and hand the totals over once, only when counting is enabled:
+#     counting = instrumentation.enabled()
+#     ...
+#     if counting:
+#         instrumentation.count('dijkstra.heap_pushes', heap_pushes)
+# Everything is collected per process, the runner resets it before every part and reads it afterwards.
+# AOC_COUNTERS is read once on import and again by reset(), so a disabled check is a global lookup, not os.environ.
+
+__counters = Counter()
+__timers = Counter()
+
+
+def __read_environment() -> bool:
+    return os.environ.get('AOC_COUNTERS', '') not in ('', '0')
+
+
+__enabled = __read_environment()
+
+
+def enabled() -> bool:
+    return __enabled
+
+
+def count(name: str, value: int = 1) -> None:
+    if __enabled:
+        __counters[name] += value
+    return None
+
+
+@contextmanager
+def timer(name: str):
+    """
+    add the time spent in the block to the timer `name`
+    """
+    if not __enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        __timers[name] += time.perf_counter() - start
+
+
+def reset() -> None:
+    """clear the counters and timers and take over a changed AOC_COUNTERS"""
+    global __enabled
+    __enabled = __read_environment()
+    __counters.clear()
+    __timers.clear()
+    return None
+
+
+def snapshot() -> dict:
+    """
+    return the current counters and timers (in seconds) as a plain dict, e.g. to send it from a worker process
+    """
+    return {**__counters, **{f'{name}.seconds': seconds for name, seconds in __timers.items()}}
+
+
+def format_counters(counters: dict | None) -> str:
+    if not counters:
+        return ''
+    return ', '.join(
+        f'{name}={value:.3f}' if isinstance(value, float) else f'{name}={value:,}'
+        for name, value in sorted(counters.items())
+    )
@@ -0,0 +1,144 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from aoc import batch, instrumentation
+from shared.logger import logger
+
+PROFILE_DIR = Path(__file__).resolve().parent.parent / 'profiles'
+TRACEMALLOC_FRAMES = 25
+MIN_COLLAPSED_MICROSECONDS = 1  # stacks that took less are left out of the collapsed output
+
+
+def __frame_label(func: tuple) -> str:
+    file, line, name = func
+    if file == '~':  # built-in function
+        return name
+    return f'{name} ({os.path.basename(file)}:{line})'
+
+
+def to_collapsed_stacks(stats: pstats.Stats) -> list[str]:
+    """
+    Convert profile stats into the collapsed stack format ('root;caller;callee microseconds') of flamegraph tools.
+    cProfile only records caller/callee pairs, not full stacks. The time of a function that is called from several
+    places is therefore split between the stacks in proportion to the time spent through each caller.
+    """
+    raw_stats = stats.stats
+    children = {}
+    for callee, (_, _, _, _, callers) in raw_stats.items():
+        for caller, (_, _, _, edge_cumulative_time) in callers.items():
+            children.setdefault(caller, []).append((callee, edge_cumulative_time))
+    roots = [func for func, (_, _, _, _, callers) in raw_stats.items() if not any(caller in raw_stats for caller in callers)]
+
+    lines = []
+    to_visit = [(root, (root,), 1.0) for root in roots]
+    while to_visit:
+        func, path, share = to_visit.pop()
+        self_time = raw_stats[func][2] * share
+        if self_time * 1_000_000 >= MIN_COLLAPSED_MICROSECONDS:
+            lines.append(f'{";".join(__frame_label(f) for f in path)} {round(self_time * 1_000_000)}')
+        for child, edge_cumulative_time in children.get(func, []):
+            child_cumulative_time = raw_stats[child][3]
+            if child in path or not child_cumulative_time:  # recursion is already part of the outer call
+                continue
+            child_share = share * edge_cumulative_time / child_cumulative_time
+            if child_cumulative_time * child_share * 1_000_000 >= MIN_COLLAPSED_MICROSECONDS:
+                to_visit.append((child, path + (child,), child_share))
+    return sorted(lines)
+
+
+def format_top_allocations(snapshot: tracemalloc.Snapshot, limit: int) -> str:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ))
+    lines = []
+    for i, stat in enumerate(snapshot.statistics('lineno')[:limit], start=1):
+        frame = stat.traceback[0]
+        lines.append(f'{i:>3}. {frame.filename}:{frame.lineno}: {stat.size / 1024:.1f} KiB in {stat.count} blocks')
+        source_line = stat.traceback.format()[-1].strip()
+        if source_line:
+            lines.append(f'       {source_line}')
+    return '\n'.join(lines)
+
+
+def trace_allocations(solve, input_data: str) -> tuple[tracemalloc.Snapshot, int]:
+    """
+    Run the solver under tracemalloc and return a snapshot taken close to the memory peak plus the peak itself.
+    A snapshot after the run would miss everything the solver already freed, so a profile hook takes a new snapshot
+    whenever a function returns with at least 10% more memory in use than at the last snapshot.
+    """
+    last_snapshot = [0, None]
+
+    def __on_event(frame, event, arg):
+        if event == 'return':
+            current_memory, _ = tracemalloc.get_traced_memory()
+            if current_memory > last_snapshot[0] * 1.1:
+                last_snapshot[:] = [current_memory, tracemalloc.take_snapshot()]
+
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+    try:
+        sys.setprofile(__on_event)
+        try:
+            solve(input_data)
+        finally:
+            sys.setprofile(None)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        snapshot = last_snapshot[1] or tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return snapshot, peak_memory
+
+
+def profile_part(day: int, part: str, output_dir: Path = PROFILE_DIR, top: int = 20) -> dict:
+    """
+    Run one part of a day, including its parse stage, once under cProfile and once under tracemalloc and write
+    - dayNN_<part>.prof: the cProfile stats, e.g. for snakeviz or pstats
+    - dayNN_<part>.collapsed: collapsed stacks for flamegraph.pl or speedscope
+    - dayNN_<part>.allocations.txt: the lines that allocated the most memory around the memory peak
+    The day module is used as it is, nothing has to be changed for profiling.
+    """
+    module = batch.get_day_module(day)
+    input_data = batch.get_input_data(module, day)
+    solve = getattr(module, f'solve_part_{part}')
+
+    profiler = cProfile.Profile()
+    instrumentation.reset()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        answer = solve(input_data)
+    finally:
+        profiler.disable()
+    seconds = time.perf_counter() - start
+    counters = instrumentation.snapshot()
+    snapshot, peak_memory = trace_allocations(solve, input_data)
+    logger.info(f'🔬 Day {day:02} part {part}: {answer} in {seconds:.3f}s (profiled), peak memory {peak_memory / 1024:.1f} KiB')
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    name = f'day{day:02}_{part}'
+    paths = {
+        'prof': output_dir / f'{name}.prof',
+        'collapsed': output_dir / f'{name}.collapsed',
+        'allocations': output_dir / f'{name}.allocations.txt',
+    }
+    profiler.dump_stats(paths['prof'])
+    paths['collapsed'].write_text('\n'.join(to_collapsed_stacks(pstats.Stats(profiler))) + '\n')
+    top_allocations = format_top_allocations(snapshot, top)
+    paths['allocations'].write_text(top_allocations + '\n')
+
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    logger.info(summary.getvalue())
+    logger.info(f'🔬 Top allocation sites around the memory peak:\n{top_allocations}')
+    if counters:
+        logger.info(f'🔬 Counters: {instrumentation.format_counters(counters)}')
+    for kind, path in paths.items():
+        logger.info(f'💾 {kind} written to {path}')
+    return paths
@@ -3,9 +3,11 @@ import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
+import argparse
 import importlib
+import os
 
-from shared.create_new_day import create_day
+from aoc import batch
 from shared.logger import logger
 from shared.utils import get_day
 
@@ -13,25 +15,78 @@ from shared.utils import get_day
 # logger.setLevel(logging.DEBUG)
 
 
-def __run_or_create_day(day: int):
+def __run_or_create_day(day: int, submit: bool = False, timeout: float | None = None, use_cache: bool = True) -> bool:
     """
     When the file for the day exists, run it
     Otherwise create the file from the template
+    The input comes from the input store and the answers are only logged, aocd is only imported when the input
+    is missing from the store (never with AOC_OFFLINE). With `submit`, the day's main() solves and submits through aocd.
+    Returns False when a part failed.
     """
     module_name = f'aoc.days.day{day:02}'
     try:
         module = importlib.import_module(module_name)
-        module.main()
-    except ModuleNotFoundError:
+    except ModuleNotFoundError as e:
+        if e.name != module_name:  # the day exists, but one of its imports is missing
+            raise
         logger.warning(f'❌ Day {day:02} not found. Creating from template...')
+        from shared.create_new_day import create_day
+
         create_day(day)
         module = importlib.import_module(module_name)
+    if submit:
         module.main()
+        return True
+
+    logger.info(f'🎄 Running puzzle day {day:02}...')
+    results = batch.run_day(day, timeout=timeout, use_cache=use_cache)
+    logger.info(f'\n{batch.format_summary(results)}')
+    return not any(result.error for result in results)
+
+
+def __parse_args(argv: list) -> tuple[argparse.Namespace, list]:
+    """
+    parse the batch options, everything else is left for get_day
+    """
+    parser = argparse.ArgumentParser(description='Run or create a single day, or run many days in parallel')
+    parser.add_argument('--all', action='store_true', help='run all existing days in parallel')
+    parser.add_argument('--days', help='run the selected days in parallel, e.g. 1-18 or 1,3,5-7')
+    parser.add_argument('--profile', nargs=2, metavar=('DAY', 'PART'), help='run one part under cProfile and tracemalloc, e.g. --profile 16 b')
+    parser.add_argument(
+        '--processes', type=int, default=None,
+        help='number of worker processes of a batch run (default: all cores), or of the solvers of a single day (default: 1)'
+    )
+    parser.add_argument('--offline', action='store_true', help='only read inputs from the input store, never use aocd')
+    parser.add_argument('--no-cache', action='store_true', help='always run the solvers, ignore the answer cache')
+    parser.add_argument('--timeout', type=float, default=None, help='abort a single part after this many seconds')
+    parser.add_argument('--counters', action='store_true', help='report the work counters of the solvers (implies --no-cache)')
+    parser.add_argument('--submit', action='store_true', help='solve a single day through aocd and submit the answers')
+    return parser.parse_known_args(argv)
 
 
 if __name__ == '__main__':
+    args, remaining_argv = __parse_args(sys.argv[1:])
+    if args.offline:
+        os.environ['AOC_OFFLINE'] = '1'
+    if args.counters:
+        os.environ['AOC_COUNTERS'] = '1'
+    if args.processes and not (args.all or args.days):
+        os.environ['AOC_PROCESSES'] = str(args.processes)  # the batch workers are daemons without pools of their own
+    if args.profile:
+        from aoc import profiling
+
+        day_num, part = args.profile
+        profiling.profile_part(int(day_num), part)
+        sys.exit(0)
+    use_cache = not (args.no_cache or args.counters)  # cached answers have no counters
+    if args.all or args.days:
+        days = batch.get_available_days() if args.all else batch.parse_day_selection(args.days)
+        results = batch.run_batch(days, processes=args.processes, timeout=args.timeout, use_cache=use_cache)
+        sys.exit(1 if any(result.error for result in results) else 0)
+
     day_num = None
     day_num = 13  # day overwrite
-    day_num = get_day(sys.argv[1:], day_num)
+    day_num = get_day(remaining_argv, day_num)
     if day_num:
-        __run_or_create_day(day_num)
+        solved = __run_or_create_day(day_num, submit=args.submit, timeout=args.timeout, use_cache=use_cache)
+        sys.exit(0 if solved else 1)
@@ -0,0 +1,232 @@
+from collections import deque, namedtuple
+from heapq import heappop, heappush
+
+from aoc import instrumentation
+
+# Result of a search.
+# `costs` maps every reached state to its lowest known cost, `predecessors` maps it to the state it was reached from
+# (a list of all states on equally cheap paths with `all_predecessors`, the start maps to None or []).
+# `goals` are the goal states reached with the lowest cost `cost`, both are empty/None without a goal or a path.
+SearchResult = namedtuple('SearchResult', ('costs', 'predecessors', 'goals', 'cost'))
+
+# Search engine on implicit graphs: instead of an adjacency dict, the caller passes a `neighbors` function that
+# generates the successors of a state on the fly. Memory therefore grows with the states that are actually reached,
+# not with all edges of the graph. States can be anything hashable, packed ints (aoc.grid.encode_state) are cheapest.
+
+
+def dijkstra(start, neighbors, is_goal=None, heuristic=None, all_predecessors: bool = False) -> SearchResult:
+    """
+    Dijkstra's algorithm, or A* when a `heuristic` (state -> lower bound of the remaining cost) is given.
+    `neighbors(state)` returns an iterable of (next_state, cost) pairs with non-negative costs.
+    With `is_goal`, the search stops as soon as no cheaper goal can follow, all goals with the lowest cost are returned.
+    The heuristic has to be consistent, otherwise A* may miss cheaper paths.
+    """
+    costs = {start: 0}
+    predecessors = {start: [] if all_predecessors else None}
+    priority_queue = [(heuristic(start) if heuristic else 0, 0, start)]
+    goals = []
+    best_cost = None
+    nodes_expanded = heap_pushes = stale_pops = 0
+
+    while priority_queue:
+        priority, cost, state = heappop(priority_queue)
+        if cost > costs[state]:
+            stale_pops += 1
+            continue
+        if best_cost is not None and priority > best_cost:
+            break
+        if is_goal is not None and is_goal(state):
+            best_cost = cost
+            goals.append(state)
+            continue
+
+        nodes_expanded += 1
+        for next_state, step_cost in neighbors(state):
+            next_cost = cost + step_cost
+            known_cost = costs.get(next_state)
+            if known_cost is None or next_cost < known_cost:
+                costs[next_state] = next_cost
+                predecessors[next_state] = [state] if all_predecessors else state
+                heappush(priority_queue, (next_cost + heuristic(next_state) if heuristic else next_cost, next_cost, next_state))
+                heap_pushes += 1
+            elif all_predecessors and next_cost == known_cost:
+                predecessors[next_state].append(state)
+
+    if instrumentation.enabled():
+        instrumentation.count('search.nodes_expanded', nodes_expanded)
+        instrumentation.count('search.heap_pushes', heap_pushes)
+        instrumentation.count('search.stale_pops', stale_pops)
+    return SearchResult(costs, predecessors, goals, best_cost)
+
+
+def bfs(start, neighbors, is_goal=None, all_predecessors: bool = False) -> SearchResult:
+    """
+    Breadth first search for graphs where every step costs 1.
+    `neighbors(state)` returns an iterable of next states, without costs.
+    Stops like `dijkstra` once all goals with the lowest number of steps are found.
+    """
+    return multi_source_bfs((start,), neighbors, is_goal=is_goal, all_predecessors=all_predecessors)
+
+
+def multi_source_bfs(starts, neighbors, is_goal=None, all_predecessors: bool = False) -> SearchResult:
+    """
+    `bfs` from several states at once, every state gets the number of steps from the nearest start.
+    Several targets are an `is_goal` like `targets.__contains__`.
+    """
+    costs = dict.fromkeys(starts, 0)
+    predecessors = {start: [] if all_predecessors else None for start in costs}
+    queue = deque(costs)
+    goals = []
+    best_cost = None
+    nodes_expanded = 0
+
+    while queue:
+        state = queue.popleft()
+        cost = costs[state]
+        if best_cost is not None and cost > best_cost:
+            break
+        if is_goal is not None and is_goal(state):
+            best_cost = cost
+            goals.append(state)
+            continue
+
+        nodes_expanded += 1
+        next_cost = cost + 1
+        for next_state in neighbors(state):
+            known_cost = costs.get(next_state)
+            if known_cost is None:
+                costs[next_state] = next_cost
+                predecessors[next_state] = [state] if all_predecessors else state
+                queue.append(next_state)
+            elif all_predecessors and known_cost == next_cost:
+                predecessors[next_state].append(state)
+
+    if instrumentation.enabled():
+        instrumentation.count('search.nodes_expanded', nodes_expanded)
+    return SearchResult(costs, predecessors, goals, best_cost)
+
+
+def bidirectional_bfs(starts, goals, neighbors, reverse_neighbors=None, with_path: bool = False) -> tuple[int | None, list]:
+    """
+    Number of steps from the nearest of the `starts` to the nearest of the `goals`, None if no goal can be reached.
+    Searches from both sides, one layer at a time from the side with the smaller frontier. On an open grid each side
+    only covers about half the distance, so both together reach a fraction of the states a one-sided `bfs` reaches.
+    `reverse_neighbors(state)` returns the states that lead to `state`, without it the graph has to be undirected.
+    With `with_path`, one shortest path (start ... goal) is returned as well, otherwise the list is empty.
+    """
+    if reverse_neighbors is None:
+        reverse_neighbors = neighbors
+    forward_costs, backward_costs = dict.fromkeys(starts, 0), dict.fromkeys(goals, 0)
+    forward_links, backward_links = dict.fromkeys(forward_costs), dict.fromkeys(backward_costs)
+    forward_frontier, backward_frontier = list(forward_costs), list(backward_costs)
+    meeting = next((state for state in forward_costs if state in backward_costs), None)
+    distance = 0 if meeting is not None else None
+    nodes_expanded = 0
+
+    while meeting is None and forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            nodes_expanded += len(forward_frontier)
+            forward_frontier, meeting, distance = __expand_layer(
+                forward_frontier, neighbors, forward_costs, forward_links, backward_costs
+            )
+        else:
+            nodes_expanded += len(backward_frontier)
+            backward_frontier, meeting, distance = __expand_layer(
+                backward_frontier, reverse_neighbors, backward_costs, backward_links, forward_costs
+            )
+
+    if instrumentation.enabled():
+        instrumentation.count('search.nodes_expanded', nodes_expanded)
+    if meeting is None or not with_path:
+        return distance, []
+    path = reconstruct_path(forward_links, meeting)
+    state = backward_links[meeting]
+    while state is not None:
+        path.append(state)
+        state = backward_links[state]
+    return distance, path
+
+
+def __expand_layer(frontier: list, neighbors, costs: dict, links: dict, other_costs: dict) -> tuple[list, object, int | None]:
+    """
+    one layer of `bidirectional_bfs`, returns the next frontier and the cheapest state where both sides meet.
+    The whole layer is expanded: the first meeting found is not necessarily on a shortest path, the cheapest one is.
+    """
+    next_frontier = []
+    meeting = distance = None
+    for state in frontier:
+        next_cost = costs[state] + 1
+        for next_state in neighbors(state):
+            if next_state in costs:
+                continue
+            costs[next_state] = next_cost
+            links[next_state] = state
+            next_frontier.append(next_state)
+            other_cost = other_costs.get(next_state)
+            if other_cost is not None and (distance is None or next_cost + other_cost < distance):
+                meeting, distance = next_state, next_cost + other_cost
+    return next_frontier, meeting, distance
+
+
+def reconstruct_path(predecessors: dict, goal) -> list:
+    """
+    follow single predecessors (a search without `all_predecessors`) back from the goal, returns start ... goal
+    """
+    path = []
+    state = goal
+    while state is not None:
+        path.append(state)
+        state = predecessors[state]
+    path.reverse()
+    return path
+
+
+def shortest_path_states(result: SearchResult) -> set:
+    """
+    all states on at least one cheapest path to a goal, from a search with `all_predecessors`.
+    Walks the predecessor DAG back from the goals once, so it stays linear however many paths there are.
+    """
+    states = set(result.goals)
+    to_visit = list(result.goals)
+    while to_visit:
+        for predecessor in result.predecessors[to_visit.pop()]:
+            if predecessor not in states:
+                states.add(predecessor)
+                to_visit.append(predecessor)
+    return states
+
+
+def count_shortest_paths(result: SearchResult) -> int:
+    """
+    number of cheapest paths to the goals, from a search with `all_predecessors`.
+    The states of the DAG are visited in the order of their costs, so every predecessor is counted before its successors.
+    Edges must have positive costs for that order to hold.
+    """
+    path_counts = {}
+    for state in sorted(shortest_path_states(result), key=result.costs.__getitem__):
+        state_predecessors = result.predecessors[state]
+        path_counts[state] = sum(path_counts[predecessor] for predecessor in state_predecessors) if state_predecessors else 1
+    return sum(path_counts[goal] for goal in result.goals)
+
+
+def iter_shortest_paths(result: SearchResult):
+    """
+    generate the cheapest paths (start ... goal) of a search with `all_predecessors` one by one.
+    There can be exponentially many, use it for visualizations and take the counts and states from the functions above.
+    """
+    for goal in result.goals:
+        # (state, link) pairs: the link chains the states between `state` and the goal
+        stack = [(goal, None)]
+        while stack:
+            state, later_link = stack.pop()
+            link = (state, later_link)
+            state_predecessors = result.predecessors[state]
+            if not state_predecessors:  # reached the start
+                path = []
+                while link:
+                    path.append(link[0])
+                    link = link[1]
+                yield path
+                continue
+            for predecessor in state_predecessors:
+                stack.append((predecessor, link))
@@ -0,0 +1,41 @@
+import logging
+
+from shared.logger import logger
+
+# Lazy debug tracing for the day modules.
+# `trace` takes %-style arguments and only formats them when debug logging is enabled, so a disabled trace costs a
+# level check. Arguments that are expensive to compute (grids, joined lists, ...) are wrapped in `Lazy`.
+# Hot loops should read `enabled()` once before the loop and skip the trace calls entirely:
+#     debug = tracing.enabled()
+#     for ...:
+#         if debug:
+#             trace('index: %s', index)
+
+
+def enabled() -> bool:
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+def trace(msg: str, *args) -> None:
+    """
+    log a debug message, `msg` is only formatted with `args` when debug logging is enabled
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg, *args, stacklevel=2)
+    return None
+
+
+class Lazy:
+    """
+    argument for `trace` that calls `function` only when the message is actually formatted
+    """
+    __slots__ = ('_function',)
+
+    def __init__(self, function):
+        self._function = function
+
+    def __str__(self) -> str:
+        return str(self._function())
+
+    def __repr__(self) -> str:
+        return repr(self._function())
@@ -0,0 +1,61 @@
+import random
+
+from aoc.days import day06
+from aoc.grid import FlatGrid
+
+EXAMPLE = '''....#.....
+.........#
+..........
+..#.......
+.......#..
+..........
+.#..^.....
+........#.
+#.........
+......#...'''
+
+# up, right, down, left like GUARD_DIRECTIONS
+STEPS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def __naive_next_stop(obstructions: set, height: int, width: int, y: int, x: int, direction: int):
+    """walk cell by cell until the next cell is an obstruction (stop there) or off the map (None)"""
+    dy, dx = STEPS[direction]
+    while 0 <= y + dy < height and 0 <= x + dx < width:
+        if (y + dy, x + dx) in obstructions:
+            return y, x
+        y, x = y + dy, x + dx
+    return None
+
+
+def test_example():
+    assert day06.solve_part_a(EXAMPLE) == '41'
+    assert day06.solve_part_b(EXAMPLE, processes=1) == '6'
+
+
+def test_parallel_mode_counts_the_same_loops():
+    assert day06.solve_part_b(EXAMPLE, processes=2) == '6'
+
+
+def test_obstacle_index_matches_a_walk():
+    rng = random.Random(0)
+    for _ in range(200):
+        height, width = rng.randint(1, 8), rng.randint(1, 8)
+        obstructions = {(y, x) for y in range(height) for x in range(width) if rng.random() < 0.2}
+        grid = FlatGrid('\n'.join(
+            ''.join('#' if (y, x) in obstructions else '.' for x in range(width)) for y in range(height)
+        ))
+        obstacles = day06.ObstacleIndex(grid)
+        for _ in range(10):
+            cell = (rng.randrange(height), rng.randrange(width))
+            added = cell not in obstructions
+            if added:  # try an obstruction like part B, then take it away again
+                obstacles.add(*cell)
+                obstructions.add(cell)
+            for _ in range(10):
+                y, x, direction = rng.randrange(height), rng.randrange(width), rng.randrange(4)
+                expected = __naive_next_stop(obstructions, height, width, y, x, direction)
+                assert obstacles.next_stop(y, x, direction) == expected
+            if added:
+                obstacles.remove(*cell)
+                obstructions.remove(cell)
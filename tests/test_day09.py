@@ -0,0 +1,73 @@
+import random
+
+from aoc.days import day09
+
+EXAMPLE = '2333133121414131402'
+
+
+def __blocks(disk_map: str) -> list:
+    """the disk block by block: the file id or None for free space"""
+    blocks = []
+    for i, length in enumerate(map(int, disk_map)):
+        blocks.extend([i // 2 if i % 2 == 0 else None] * length)
+    return blocks
+
+
+def __checksum(blocks: list) -> int:
+    return sum(position * file_id for position, file_id in enumerate(blocks) if file_id is not None)
+
+
+def __simulate_blocks(disk_map: str) -> int:
+    """part A block by block: move the last block into the leftmost free block until there is no gap left"""
+    blocks = __blocks(disk_map)
+    left, right = 0, len(blocks) - 1
+    while True:
+        while left < len(blocks) and blocks[left] is not None:
+            left += 1
+        while right >= 0 and blocks[right] is None:
+            right -= 1
+        if left >= right:
+            return __checksum(blocks)
+        blocks[left], blocks[right] = blocks[right], None
+
+
+def __simulate_files(disk_map: str) -> int:
+    """part B block by block: every file from the last one on moves to the leftmost run of free blocks that fits"""
+    blocks = __blocks(disk_map)
+    for file_id in range((len(disk_map) - 1) // 2, -1, -1):
+        positions = [position for position, block in enumerate(blocks) if block == file_id]
+        if not positions:
+            continue
+        run = 0
+        for position in range(positions[0]):
+            run = run + 1 if blocks[position] is None else 0
+            if run == len(positions):
+                for old, new in zip(positions, range(position - run + 1, position + 1)):
+                    blocks[old], blocks[new] = None, file_id
+                break
+    return __checksum(blocks)
+
+
+def __random_disk_map(rng: random.Random) -> str:
+    # plenty of zeros: empty files, files without a gap behind them
+    return ''.join(str(rng.choice((0, 0, 1, 2, 3, 5, 9))) for _ in range(rng.randint(1, 30)))
+
+
+def test_examples():
+    assert day09.solve_part_a(EXAMPLE) == '1928'
+    assert day09.solve_part_b(EXAMPLE) == '2858'
+
+
+def test_blocks_match_a_simulation():
+    rng = random.Random(0)
+    disk_maps = ['0', '1', '10', '90', '12345', EXAMPLE] + [__random_disk_map(rng) for _ in range(500)]
+    for disk_map in disk_maps:
+        assert day09.compact_blocks_checksum(day09.read_disk_map(disk_map)) == __simulate_blocks(disk_map), disk_map
+
+
+def test_files_match_a_simulation():
+    rng = random.Random(1)
+    # 11: nothing to move, 10111: a zero-length gap, 11012: only the gaps around the empty file 1 together fit file 2
+    disk_maps = ['0', '11', '10111', '11012', '2101', EXAMPLE] + [__random_disk_map(rng) for _ in range(500)]
+    for disk_map in disk_maps:
+        assert day09.compact_files_checksum(day09.read_disk_map(disk_map)) == __simulate_files(disk_map), disk_map
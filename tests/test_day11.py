@@ -0,0 +1,39 @@
+from collections import Counter
+
+from aoc.days import day11
+
+
+def __naive_blink(stones: list[int]) -> list[int]:
+    """the puzzle rules on the decimal strings"""
+    next_stones = []
+    for stone in stones:
+        digits = str(stone)
+        if stone == 0:
+            next_stones.append(1)
+        elif len(digits) % 2 == 0:
+            next_stones.extend((int(digits[:len(digits) // 2]), int(digits[len(digits) // 2:])))
+        else:
+            next_stones.append(stone * 2024)
+    return next_stones
+
+
+def test_example():
+    assert day11.count_stones([125, 17], 6) == 22
+    assert day11.solve_part_a('125 17') == '55312'
+    assert day11.count_stones([125, 17], 0) == 2
+
+
+def test_blinks_match_the_rules():
+    stones = [0, 1, 10, 99, 999, 1000, 2024, 125, 17]
+    for counts in day11.iter_blinks(stones, 15):
+        stones = __naive_blink(stones)
+        assert counts == Counter(stones)
+
+
+def test_stones_beyond_the_powers_of_ten_table():
+    # 10**64 has 65 digits, 10**69 + 7 has 70 and splits in two halves of 35 digits
+    stones = [10 ** 64, 10 ** 69 + 7, 3 * 10 ** 99 + 1]
+    expected = stones
+    for counts in day11.iter_blinks(stones, 4):
+        expected = __naive_blink(expected)
+        assert counts == Counter(expected)
@@ -0,0 +1,33 @@
+from aoc.days import day15
+
+EXAMPLE_A = '''########
+#..O.O.#
+##@.O..#
+#...O..#
+#.#.O..#
+#...O..#
+#......#
+########
+
+<^^>>>vv<v>>v<<'''
+
+EXAMPLE_B = '''#######
+#...#.#
+#.....#
+#..OO@#
+#..O..#
+#.....#
+#######
+
+<vv<<^^<<^^'''
+
+
+def test_examples():
+    assert day15.solve_part_a(EXAMPLE_A) == '2028'
+    assert day15.solve_part_b(EXAMPLE_B) == '618'
+
+
+def test_the_border_blocks_like_a_wall():
+    # no walls: the robot pushes the box up to the edge of the map and no further
+    assert day15.solve_part_a('@O.\n\n>>>>^v') == '2'
+    assert day15.solve_part_b('@O.\n\n>>>>>>^v') == '4'
@@ -0,0 +1,32 @@
+import random
+
+from aoc.days import day18
+from aoc.grid import FlatGrid
+
+
+def __random_bytes(rng: random.Random, size: int) -> list[tuple[int, int]]:
+    """falling bytes as (y, x), some of them on the start or the end and some on the same cell twice"""
+    cells = [(y, x) for y in range(size) for x in range(size)]
+    return [rng.choice(cells) for _ in range(rng.randint(1, size * size))]
+
+
+def test_distances_over_time_match_a_search_per_byte():
+    rng = random.Random(0)
+    for _ in range(300):
+        size = rng.randint(2, 10)
+        grid, start_index, end_index = day18.create_memory_space(size)
+        corrupted_cells = [grid.index(p) for p in __random_bytes(rng, size)]
+        distances = day18.get_distances_over_time(grid, corrupted_cells, start_index, end_index)
+
+        expected = []
+        for index in corrupted_cells:
+            grid[index] = '#'
+            distance = grid.distance_field((start_index,))[end_index]
+            expected.append(None if distance == -1 else distance)
+        assert distances == expected
+
+
+def test_distances_over_time_leave_the_grid_unchanged():
+    grid = FlatGrid.filled(3, 3)
+    day18.get_distances_over_time(grid, [grid.index((0, 1)), grid.index((1, 0))], grid.index((0, 0)), grid.index((2, 2)))
+    assert str(grid) == '...\n...\n...'
@@ -0,0 +1,23 @@
+import random
+
+from aoc.disjoint_set import DisjointSet
+
+
+def test_disjoint_set_matches_naive_partition():
+    rng = random.Random(0)
+    for _ in range(200):
+        size = rng.randint(1, 30)
+        disjoint_set = DisjointSet(size)
+        labels = list(range(size))  # naive partition: the label of every element, relabeled on every merge
+        for _ in range(rng.randint(0, 2 * size)):
+            element1, element2 = rng.randrange(size), rng.randrange(size)
+            label1, label2 = labels[element1], labels[element2]
+            assert disjoint_set.union(element1, element2) == (label1 != label2)
+            labels = [label1 if label == label2 else label for label in labels]
+
+            for element in range(size):
+                assert disjoint_set.connected(element, element2) == (labels[element] == labels[element2])
+        roots = {disjoint_set.find(element) for element in range(size)}
+        assert len(roots) == len(set(labels))
+        for root in roots:
+            assert disjoint_set.sizes[root] == sum(disjoint_set.find(element) == root for element in range(size))
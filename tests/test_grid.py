@@ -0,0 +1,122 @@
+import random
+from collections import deque
+
+from aoc.grid import DISTANCE_FIELD_CACHE_SIZE, OUTSIDE, FlatGrid
+
+
+def __random_grid(rng: random.Random) -> FlatGrid:
+    height, width = rng.randint(1, 10), rng.randint(1, 10)
+    return FlatGrid('\n'.join(''.join('#' if rng.random() < 0.3 else '.' for _ in range(width)) for _ in range(height)))
+
+
+def __naive_distances(grid: FlatGrid, source: int) -> dict:
+    """BFS on (y, x) Points with bounds checks, independent of the flat indices"""
+    start = grid.point(source)
+    if grid[start] == '#':
+        return {}
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        y, x = queue.popleft()
+        for next_p in ((y - 1, x), (y, x + 1), (y + 1, x), (y, x - 1)):
+            if grid.in_bounds(next_p) and grid[next_p] != '#' and next_p not in distances:
+                distances[next_p] = distances[(y, x)] + 1
+                queue.append(next_p)
+    return {grid.index(p): distance for p, distance in distances.items()}
+
+
+def test_distance_field_matches_naive_bfs():
+    rng = random.Random(0)
+    for _ in range(300):
+        grid = __random_grid(rng)
+        source = grid.index((rng.randrange(grid.height), rng.randrange(grid.width)))
+        expected = __naive_distances(grid, source)
+        field = grid.distance_field((source,))
+        assert {index: distance for index, distance in enumerate(field) if distance != -1} == expected
+
+
+def test_shortest_path_cells():
+    grid = FlatGrid('...\n.#.\n...')
+    start, end = grid.index((0, 0)), grid.index((2, 2))
+    # both ways around the wall are shortest
+    assert sorted(grid.point(index) for index in grid.shortest_path_cells(start, end)) == sorted(
+        [(0, 0), (0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)]
+    )
+    grid[(1, 0)] = '#'
+    assert sorted(grid.point(index) for index in grid.shortest_path_cells(start, end)) == [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)]
+    grid[(0, 1)] = '#'
+    assert grid.shortest_path_cells(start, end) == []
+
+
+def test_distance_field_cache():
+    grid = FlatGrid('....\n....')
+    source = grid.index((0, 0))
+    field = grid.distance_field((source,))
+    assert grid.distance_field((source,)) is field
+
+    grid[(0, 1)] = '#'  # writes through __setitem__ drop the cache
+    assert grid.distance_field((source,)) is not field
+    field = grid.distance_field((source,))
+
+    grid.cells[grid.index((1, 0))] = ord('#')  # direct writes need invalidate()
+    grid.invalidate()
+    assert grid.distance_field((source,))[grid.index((1, 1))] == -1
+
+    for x in range(4):
+        for y in range(2):
+            grid.distance_field((grid.index((y, x)),))
+    assert len(grid._distance_fields) == DISTANCE_FIELD_CACHE_SIZE
+
+
+def test_sentinel_border():
+    grid = FlatGrid('ab\ncd', padding=2)
+    assert len(grid.cells) == (2 + 4) * (2 + 4)
+    inside = {grid.index((y, x)) for y in range(2) for x in range(2)}
+    assert all(chr(value) == OUTSIDE for index, value in enumerate(grid.cells) if index not in inside)
+    # leaving the grid into any direction ends on the border, it never wraps around into another row
+    assert grid[grid.index((0, 1)) + grid.offset((0, 1))] == OUTSIDE
+    assert grid[grid.index((1, 0)) + grid.offset((0, -1))] == OUTSIDE
+    assert grid[grid.index((0, 0)) + grid.offset((-1, 0))] == OUTSIDE
+    assert grid[grid.index((1, 1)) + grid.offset((1, 0))] == OUTSIDE
+
+
+def test_index_point_offset_round_trip():
+    grid = FlatGrid('....\n....\n....')
+    for p in ((0, 0), (1, 2), (2, 3)):
+        index = grid.index(p)
+        assert grid.point(index) == p
+        for direction in ((-1, 0), (0, 1), (1, 0), (0, -1)):
+            assert grid.point(index + grid.offset(direction)) == (p[0] + direction[0], p[1] + direction[1])
+    assert grid[(3, 0)] is None and grid[(0, -1)] is None
+
+
+def test_rows_columns_and_find_all():
+    grid = FlatGrid('#.#\n..#\n#..')
+    assert [grid.row(y) for y in range(3)] == ['#.#', '..#', '#..']
+    assert [grid.column(x) for x in range(3)] == ['#.#', '...', '##.']
+    assert str(grid) == '#.#\n..#\n#..'
+    assert [grid.point(index) for index in grid.find_all('#')] == [(0, 0), (0, 2), (1, 2), (2, 0)]
+    assert grid.find('x') == -1 and grid.find_all('x') == []
+    assert list(grid)[:3] == [((0, 0), '#'), ((0, 1), '.'), ((0, 2), '#')]
+
+    shared = FlatGrid.from_buffer(memoryview(grid.cells), grid.height, grid.width)
+    assert [shared.row(y) for y in range(3)] == ['#.#', '..#', '#..']
+    assert [shared.column(x) for x in range(3)] == ['#.#', '...', '##.']
+
+
+def test_filled_and_copy():
+    grid = FlatGrid.filled(2, 3, '.')
+    assert grid.cells == FlatGrid('...\n...').cells
+    copy = grid.copy()
+    copy[(1, 1)] = '#'
+    assert str(grid) == '...\n...' and str(copy) == '...\n.#.'
+
+
+def test_distance_field_cache_keeps_the_recently_used_fields():
+    grid = FlatGrid('.' * (DISTANCE_FIELD_CACHE_SIZE + 1))
+    hot = grid.distance_field((grid.index((0, 0)),))
+    for x in range(1, DISTANCE_FIELD_CACHE_SIZE + 1):
+        assert grid.distance_field((grid.index((0, 0)),)) is hot  # a hit makes it the most recently used field
+        grid.distance_field((grid.index((0, x)),))
+    assert grid.distance_field((grid.index((0, 0)),)) is hot
+    assert (grid.index((0, 1)),) not in {sources for sources, _ in grid._distance_fields}
@@ -0,0 +1,13 @@
+import pytest
+
+from aoc import inputs
+
+
+@pytest.mark.parametrize('mmap_threshold', (1, inputs.MMAP_THRESHOLD))
+def test_read_input_strips_trailing_newlines(tmp_path, monkeypatch, mmap_threshold):
+    monkeypatch.setattr(inputs, 'MMAP_THRESHOLD', mmap_threshold)
+    path = tmp_path / 'day01.txt'
+    path.write_bytes('1,2\r\n3,4 ✓\n\n'.encode('utf-8'))
+    assert inputs.read_input(path) == '1,2\r\n3,4 ✓'
+    path.write_bytes(b'\n')
+    assert inputs.read_input(path) == ''
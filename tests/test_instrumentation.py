@@ -0,0 +1,19 @@
+from aoc import instrumentation
+
+
+def test_counting_follows_the_environment_on_reset(monkeypatch):
+    monkeypatch.setenv('AOC_COUNTERS', '1')
+    instrumentation.reset()
+    assert instrumentation.enabled()
+    instrumentation.count('steps', 2)
+    with instrumentation.timer('block'):
+        pass
+    assert instrumentation.snapshot()['steps'] == 2 and 'block.seconds' in instrumentation.snapshot()
+
+    monkeypatch.setenv('AOC_COUNTERS', '0')
+    instrumentation.reset()
+    assert not instrumentation.enabled()
+    instrumentation.count('steps')
+    with instrumentation.timer('block'):
+        pass
+    assert instrumentation.snapshot() == {}
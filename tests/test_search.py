@@ -0,0 +1,126 @@
+import random
+from math import comb
+
+from aoc import search
+
+
+def __random_graph(rng: random.Random, weighted: bool) -> dict:
+    """directed graph on the nodes 0 .. n-1 as {node: {next_node: cost}}"""
+    size = rng.randint(1, 12)
+    return {
+        node: {rng.randrange(size): rng.randint(0, 5) if weighted else 1 for _ in range(rng.randint(0, 3))}
+        for node in range(size)
+    }
+
+
+def __naive_costs(graph: dict, starts) -> dict:
+    """Bellman-Ford: relax every edge until nothing changes, independent of any queue order"""
+    costs = dict.fromkeys(starts, 0)
+    changed = True
+    while changed:
+        changed = False
+        for node, edges in graph.items():
+            if node not in costs:
+                continue
+            for next_node, cost in edges.items():
+                if next_node not in costs or costs[node] + cost < costs[next_node]:
+                    costs[next_node] = costs[node] + cost
+                    changed = True
+    return costs
+
+
+def __reverse(graph: dict) -> dict:
+    reverse = {node: {} for node in graph}
+    for node, edges in graph.items():
+        for next_node, cost in edges.items():
+            reverse[next_node][node] = cost
+    return reverse
+
+
+def __path_cost(graph: dict, path: list) -> int:
+    return sum(graph[node][next_node] for node, next_node in zip(path, path[1:]))
+
+
+def test_dijkstra_matches_naive_costs():
+    rng = random.Random(0)
+    for _ in range(300):
+        graph = __random_graph(rng, weighted=True)
+        start = rng.randrange(len(graph))
+        expected = __naive_costs(graph, (start,))
+        result = search.dijkstra(start, lambda node: graph[node].items())
+        assert result.costs == expected
+        for node in expected:
+            path = search.reconstruct_path(result.predecessors, node)
+            assert path[0] == start and path[-1] == node
+            assert __path_cost(graph, path) == expected[node]
+
+        targets = set(rng.sample(range(len(graph)), rng.randint(1, len(graph))))
+        result = search.dijkstra(start, lambda node: graph[node].items(), is_goal=targets.__contains__)
+        # the search does not go on behind a goal
+        costs = __naive_costs({node: {} if node in targets else edges for node, edges in graph.items()}, (start,))
+        reached = {node: cost for node, cost in costs.items() if node in targets}
+        assert result.cost == (min(reached.values()) if reached else None)
+        assert set(result.goals) == {node for node, cost in reached.items() if cost == result.cost}
+
+
+def test_a_star_finds_the_dijkstra_costs():
+    rng = random.Random(1)
+    for _ in range(100):
+        size = rng.randint(1, 8)
+        free = {(y, x) for y in range(size) for x in range(size) if rng.random() < 0.7} | {(0, 0), (size - 1, size - 1)}
+        goal = (size - 1, size - 1)
+
+        def neighbors(p):
+            y, x = p
+            return [(next_p, 1) for next_p in ((y - 1, x), (y, x + 1), (y + 1, x), (y, x - 1)) if next_p in free]
+
+        expected = search.dijkstra((0, 0), neighbors, is_goal=goal.__eq__)
+        result = search.dijkstra((0, 0), neighbors, is_goal=goal.__eq__, heuristic=lambda p: goal[0] - p[0] + goal[1] - p[1])
+        assert result.cost == expected.cost
+
+
+def test_bfs_matches_naive_costs():
+    rng = random.Random(2)
+    for _ in range(300):
+        graph = __random_graph(rng, weighted=False)
+        starts = rng.sample(range(len(graph)), rng.randint(1, len(graph)))
+        expected = __naive_costs(graph, starts)
+        assert search.multi_source_bfs(starts, graph.__getitem__).costs == expected
+        assert search.bfs(starts[0], graph.__getitem__).costs == __naive_costs(graph, starts[:1])
+
+
+def test_bidirectional_bfs_matches_naive_costs():
+    rng = random.Random(3)
+    for _ in range(300):
+        graph = __random_graph(rng, weighted=False)
+        reverse = __reverse(graph)
+        starts = rng.sample(range(len(graph)), rng.randint(1, min(len(graph), 2)))
+        goals = rng.sample(range(len(graph)), rng.randint(1, min(len(graph), 2)))
+        costs = __naive_costs(graph, starts)
+        reached = [costs[goal] for goal in goals if goal in costs]
+
+        distance, path = search.bidirectional_bfs(starts, goals, graph.__getitem__, reverse.__getitem__, with_path=True)
+        assert distance == (min(reached) if reached else None)
+        if distance is None:
+            assert path == []
+        else:
+            assert path[0] in starts and path[-1] in goals
+            assert len(path) == distance + 1 and __path_cost(graph, path) == distance
+
+
+def test_shortest_paths_on_an_open_grid():
+    height, width = 4, 5
+    goal = (height - 1, width - 1)
+
+    def neighbors(p):
+        y, x = p
+        return [next_p for next_p in ((y + 1, x), (y, x + 1), (y - 1, x), (y, x - 1))
+                if 0 <= next_p[0] < height and 0 <= next_p[1] < width]
+
+    result = search.bfs((0, 0), neighbors, is_goal=goal.__eq__, all_predecessors=True)
+    # every shortest path is a sequence of downs and rights
+    assert search.count_shortest_paths(result) == comb(height + width - 2, height - 1)
+    assert search.shortest_path_states(result) == {(y, x) for y in range(height) for x in range(width)}
+    paths = list(search.iter_shortest_paths(result))
+    assert len(paths) == len(set(map(tuple, paths))) == search.count_shortest_paths(result)
+    assert all(path[0] == (0, 0) and path[-1] == goal and len(path) == height + width - 1 for path in paths)